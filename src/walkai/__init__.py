@@ -1,5 +1,24 @@
 """Walkai CLI package."""
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "cli"]
 
 __version__ = "0.1.0"
+
+
+def cli() -> None:
+    """Console-script entry point.
+
+    Version lookups are answered here, before Typer and the command
+    modules are imported, so 'walkai version' stays near interpreter
+    startup cost.
+    """
+
+    import sys
+
+    if len(sys.argv) == 2 and sys.argv[1] in {"version", "-v", "--version"}:
+        print(__version__)
+        return
+
+    from walkai.main import app
+
+    app()
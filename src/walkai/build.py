@@ -1,13 +1,17 @@
 """Image build helpers backed by the pack CLI."""
 
+import os
 import shutil
 import subprocess
-from collections.abc import Iterable
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any
 
-import tomli_w
+import pathspec
 
 from walkai.project import (
     ProjectConfigError,
@@ -17,22 +21,85 @@ from walkai.project import (
 
 DEFAULT_BUILDER = "heroku/builder:24"
 
+# Directories that never belong in a build context, used when the project
+# does not ship its own ignore file (and merged with it when it does).
+_DEFAULT_EXCLUSIONS = (
+    ".git",
+    "__pycache__",
+    ".mypy_cache__",
+    ".pytest_cache",
+    "env",
+    ".vscode",
+    ".venv",
+)
+
+# Ignore files honoured at the project root, in merge order.
+_IGNORE_FILES = (".packignore", ".dockerignore", ".gitignore")
+
+# Below this many files the thread pool costs more than it saves.
+_PARALLEL_COPY_THRESHOLD = 32
+
 
 class BuildError(RuntimeError):
     """Raised when the container image build fails."""
 
 
+@contextmanager
+def _staging_directory(root: Path) -> Iterator[Path]:
+    """Yield a scratch directory used as the pack build context.
+
+    The directory is created next to the project when possible so it lives
+    on the same filesystem and staging can hardlink every file instead of
+    rewriting its bytes. When the parent is not writable we fall back to
+    the system temporary directory (where staging copies across devices).
+    """
+
+    try:
+        scratch = tempfile.mkdtemp(prefix=".walkai-build-", dir=root.parent)
+    except OSError:
+        scratch = tempfile.mkdtemp(prefix=".walkai-build-")
+
+    try:
+        yield Path(scratch)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file into the build context, copying only when linking fails.
+
+    The staged sources are read-only input to pack, so a hardlink is as good
+    as a copy while avoiding the byte-for-byte rewrite. Cross-device staging
+    (or filesystems without hardlink support) falls back to a real copy.
+    """
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        # The context is ephemeral input to pack, so source timestamps and
+        # extended attributes are irrelevant; only the executable bit has
+        # to survive for scripts. copyfile skips copy2's copystat syscalls.
+        shutil.copyfile(src, dst)
+        mode = os.stat(src).st_mode
+        if mode & 0o111:
+            os.chmod(dst, mode)
+
+
+def _load_ignore_patterns(root: Path) -> pathspec.PathSpec:
+    """Build the gitignore-style spec that prunes the build context."""
+
+    lines = [f"{name}/" for name in _DEFAULT_EXCLUSIONS]
+    for candidate in _IGNORE_FILES:
+        ignore_file = root / candidate
+        if ignore_file.exists():
+            lines.extend(ignore_file.read_text().splitlines())
+
+    return pathspec.GitIgnoreSpec.from_lines(lines)
+
+
 def _copy_project_sources(project: WalkAIProjectConfig, destination: Path) -> None:
-    """Copy the project sources to the temporary build context."""
-    exclusions = {
-        ".git",
-        "__pycache__",
-        ".mypy_cache__",
-        ".pytest_cache",
-        "env",
-        ".vscode",
-        ".venv",
-    }
+    """Stage the project sources into the temporary build context."""
+    spec = _load_ignore_patterns(project.root)
 
     excluded_children: dict[Path, set[str]] = {}
     for ignored_path in project.ignore:
@@ -44,29 +111,60 @@ def _copy_project_sources(project: WalkAIProjectConfig, destination: Path) -> No
         key = parent if parent != Path(".") else Path()
         excluded_children.setdefault(key, set()).add(relative.name)
 
-    def ignore(directory: str, names: list[str]) -> set[str]:  # pragma: no cover
-        path = Path(directory)
-        try:
-            relative_dir = path.relative_to(project.root)
-        except ValueError:
-            relative_dir = Path()
-        if relative_dir == Path("."):
-            relative_dir = Path()
-
-        excluded = set(exclusions)
-        excluded.update(excluded_children.get(relative_dir, set()))
-        return {name for name in names if name in excluded}
-
-    shutil.copytree(project.root, destination, dirs_exist_ok=True, ignore=ignore)
-    (destination / "Procfile").write_text(f"entrypoint: {project.entrypoint}\n")
+    pending: list[tuple[str, str]] = []
+
+    def stage_directory(source_dir: str, relative_dir: Path) -> None:
+        excluded = excluded_children.get(relative_dir, set())
+        target_dir = destination / relative_dir
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        # scandir exposes the directory-entry type without extra stat
+        # calls, and pruned directories are never scanned at all.
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                if entry.name in excluded:
+                    continue
+                relative = relative_dir / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not spec.match_file(relative.as_posix() + "/"):
+                        stage_directory(entry.path, relative)
+                elif entry.name == "Procfile" and not relative_dir.parts:
+                    # The Procfile is synthesized below. Staging the
+                    # project's own copy would hardlink it, and the later
+                    # write would truncate the user's file through the
+                    # shared inode.
+                    continue
+                elif not spec.match_file(relative.as_posix()):
+                    pending.append((entry.path, str(target_dir / entry.name)))
+
+    stage_directory(str(project.root), Path())
+
+    # Staging is I/O bound, so large projects benefit from linking/copying
+    # files concurrently; small ones stay on the serial path.
+    if len(pending) <= _PARALLEL_COPY_THRESHOLD:
+        for src, dst in pending:
+            _link_or_copy(src, dst)
+    else:
+        with ThreadPoolExecutor() as executor:
+            for _ in executor.map(lambda pair: _link_or_copy(*pair), pending):
+                pass
+
+    # Procfile is synthesized by walkai; the staging walk above skips any
+    # project-level Procfile so this write cannot reach back into the
+    # source tree.
+    (destination / "Procfile").write_bytes(
+        b"entrypoint: " + project.entrypoint.encode("utf-8") + b"\n"
+    )
 
 
 def _write_heroku_project_descriptor(context: Path, packages: tuple[str, ...]) -> None:
     """Ensure project.toml declares the Debian packages for Heroku builds."""
 
-    normalised_packages = [pkg.strip() for pkg in packages if pkg.strip()]
-    seen: set[str] = set()
-    deduped = [pkg for pkg in normalised_packages if not (pkg in seen or seen.add(pkg))]
+    import tomli_w  # deferred: only needed for projects with os_dependencies
+
+    deduped = list(
+        dict.fromkeys(stripped for pkg in packages if (stripped := pkg.strip()))
+    )
     if not deduped:
         return
 
@@ -113,12 +211,62 @@ def _build_command(
         "if-not-present",
     ]
 
-    for key, value in env_variables:
-        command.extend(["--env", f"{key}={value}"])
+    command.extend(
+        arg for key, value in env_variables for arg in ("--env", f"{key}={value}")
+    )
 
     return command
 
 
+def _staging_is_redundant(config: WalkAIProjectConfig) -> bool:
+    """Whether pack can build straight from the project root.
+
+    Staging exists to synthesize Procfile/project.toml and to filter
+    ignored paths out of the context. When the project declares no
+    os_dependencies or ignore entries, ships no ignore file, keeps none of
+    the default-excluded directories at its root and already has the exact
+    Procfile we would write, the copy would reproduce the tree verbatim
+    and can be skipped.
+    """
+
+    if config.os_dependencies or config.ignore:
+        return False
+
+    root = config.root
+    if any((root / name).exists() for name in _IGNORE_FILES + _DEFAULT_EXCLUSIONS):
+        return False
+
+    procfile = root / "Procfile"
+    try:
+        return procfile.read_text() == f"entrypoint: {config.entrypoint}\n"
+    except OSError:
+        return False
+
+
+def _run_pack(command: list[str]) -> None:
+    """Run pack, relaying its output line by line as it arrives."""
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    except FileNotFoundError as exc:  # pragma: no cover - direct subprocess failure
+        raise BuildError(
+            "The 'pack' CLI is not installed or not found in PATH."
+        ) from exc
+
+    with process:
+        for line in process.stdout or ():
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    if process.returncode != 0:
+        raise BuildError(f"pack build failed with exit code {process.returncode}.")
+
+
 def build_image(
     project_dir: Path,
     image: str | None = None,
@@ -133,8 +281,17 @@ def build_image(
     target_image = image or config.default_image()
 
     env_values: list[tuple[str, str]] = []
-    with TemporaryDirectory() as build_context:
-        context_path = Path(build_context)
+
+    if _staging_is_redundant(config):
+        command = _build_command(
+            image=target_image,
+            build_path=config.root,
+            env_variables=env_values,
+        )
+        _run_pack(command)
+        return target_image
+
+    with _staging_directory(config.root) as context_path:
         _copy_project_sources(config, context_path)
 
         if config.os_dependencies:
@@ -146,15 +303,6 @@ def build_image(
             env_variables=env_values,
         )
 
-        try:
-            subprocess.run(command, check=True)
-        except FileNotFoundError as exc:  # pragma: no cover - direct subprocess failure
-            raise BuildError(
-                "The 'pack' CLI is not installed or not found in PATH."
-            ) from exc
-        except subprocess.CalledProcessError as exc:
-            raise BuildError(
-                f"pack build failed with exit code {exc.returncode}."
-            ) from exc
+        _run_pack(command)
 
     return target_image
@@ -1,13 +1,10 @@
 """Helpers for managing Walkai CLI configuration."""
 
+import functools
 import os
-import textwrap
-import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 
-from platformdirs import user_config_dir
-
 
 class ConfigError(RuntimeError):
     """Raised when the persisted configuration is invalid."""
@@ -20,6 +17,23 @@ class WalkAIAPIConfig:
     url: str
     pat: str
 
+    def __post_init__(self) -> None:
+        # Normalise the URL once at construction; the PAT is deliberately
+        # left untouched since tokens may legitimately contain whitespace.
+        self.url = self.url.strip()
+
+    @property
+    def jobs_endpoint(self) -> str:
+        """Job submission endpoint derived from the base URL."""
+
+        return f"{self.url.rstrip('/')}/jobs/"
+
+    @property
+    def auth_headers(self) -> dict[str, str]:
+        """Fresh Authorization headers for a request to the API."""
+
+        return {"Authorization": f"Bearer {self.pat}"}
+
 
 @dataclass(slots=True)
 class WalkAIConfig:
@@ -28,24 +42,47 @@ class WalkAIConfig:
     walkai_api: WalkAIAPIConfig
 
 
-_CONFIG_DIR = Path(user_config_dir("walkai", "walkai"))
-_CONFIG_FILE = _CONFIG_DIR / "config.toml"
+@functools.cache
+def _config_dir() -> Path:
+    """Resolve the per-user configuration directory lazily."""
+
+    from platformdirs import user_config_dir
+
+    return Path(user_config_dir("walkai", "walkai"))
 
 
 def config_path() -> Path:
     """Return the path where the CLI configuration is stored."""
 
-    return _CONFIG_FILE
+    return _config_dir() / "config.toml"
+
+
+# Parsed configuration keyed on (path, mtime) so repeated loads skip the
+# TOML re-parse while still noticing edits to the file.
+_config_cache: dict[tuple[Path, int], WalkAIConfig] = {}
 
 
 def load_config() -> WalkAIConfig | None:
     """Load the saved CLI configuration, if present."""
 
-    if not _CONFIG_FILE.exists():
+    import tomllib  # deferred: only needed when a config file exists
+
+    config_file = config_path()
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
 
+    cache_key = (config_file, mtime_ns)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        payload = tomllib.loads(_CONFIG_FILE.read_text())
+        with config_file.open("rb") as fp:
+            payload = tomllib.load(fp)
+    except FileNotFoundError:  # pragma: no cover - removed between stat and open
+        return None
     except tomllib.TOMLDecodeError as exc:  # type: ignore[attr-defined]
         raise ConfigError(f"Failed to parse configuration file: {exc}") from exc
 
@@ -63,38 +100,39 @@ def load_config() -> WalkAIConfig | None:
             f"Configuration file is missing the required field: walkai.{exc.args[0]}"
         ) from exc
 
-    return WalkAIConfig(walkai_api=walkai_api_config)
+    config = WalkAIConfig(walkai_api=walkai_api_config)
+    _config_cache[cache_key] = config
+    return config
 
 
 def save_config(config: WalkAIConfig) -> Path:
     """Persist the given CLI configuration to disk."""
 
-    _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    config_file = config_path()
+    config_file.parent.mkdir(parents=True, exist_ok=True)
     walkai = config.walkai_api
-    content = textwrap.dedent(
-        f"""
-        [walkai]
-        api_url = \"{walkai.url}\"
-        pat = \"{walkai.pat}\"
-        """
-    ).strip()
+    content = f'[walkai]\napi_url = "{walkai.url}"\npat = "{walkai.pat}"\n'
 
-    _CONFIG_FILE.write_text(content + "\n")
+    # Create the file with owner-only permissions up front instead of
+    # writing it world-readable and chmod-ing afterwards, and write to a
+    # sibling temp path so the rename is atomic: a crash mid-write leaves
+    # the existing credentials intact instead of a truncated file.
+    tmp_file = config_file.with_suffix(".tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as fp:
+        fp.write(content)
+    os.replace(tmp_file, config_file)
 
-    if os.name != "nt":  # tighten permissions on POSIX systems
-        os.chmod(_CONFIG_FILE, 0o600)
-
-    return _CONFIG_FILE
+    return config_file
 
 
 def delete_config() -> bool:
     """Delete the persisted configuration if it exists."""
 
-    if not _CONFIG_FILE.exists():
-        return False
-
     try:
-        _CONFIG_FILE.unlink()
+        config_path().unlink()
+    except FileNotFoundError:
+        return False
     except OSError as exc:  # pragma: no cover - defensive guard
         raise ConfigError(f"Failed to delete configuration file: {exc}") from exc
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+import atexit
+import hashlib
+import time
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from walkai.configuration import WalkAIAPIConfig
 
@@ -23,79 +28,189 @@ def _auth_headers(api: WalkAIAPIConfig) -> dict[str, str]:
     return {"Authorization": f"Bearer {api.pat}"}
 
 
+# Endpoint paths, fixed at import time so request construction does no
+# per-call string formatting (base URL and auth live on the client).
+_VOLUMES_ENDPOINT = "/volumes/"
+_VOLUME_INPUTS_ENDPOINT = "/volumes/inputs"
+_PRESIGNEDS_ENDPOINT = "/volumes/inputs/presigneds"
+
+_clients: dict[tuple[str, str], httpx.Client] = {}
+
+
+def _close_clients() -> None:  # pragma: no cover - process teardown
+    for client in _clients.values():
+        client.close()
+
+
+atexit.register(_close_clients)
+
+
+# Listings change slowly, so parsed results are kept briefly in-process;
+# chained commands within the TTL skip the round-trip entirely.
+_LIST_CACHE_TTL = 60.0
+
+_list_cache: dict[tuple[str, str, str], tuple[float, list[dict[str, Any]]]] = {}
+
+
+def _cached_listing(key: tuple[str, str, str]) -> list[dict[str, Any]] | None:
+    entry = _list_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_listing(key: tuple[str, str, str], value: list[dict[str, Any]]) -> None:
+    _list_cache[key] = (time.monotonic() + _LIST_CACHE_TTL, value)
+
+
+# Last ETag and parsed payload per endpoint, so expired TTL entries can
+# be revalidated with If-None-Match instead of re-downloading the body.
+_etag_cache: dict[tuple[str, str, str], tuple[str, list[dict[str, Any]]]] = {}
+
+
+def _volume_name(entry: dict[str, Any]) -> str:
+    """Extract a volume's display name, preferring the PVC name."""
+
+    name = entry.get("pvc_name") or entry.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise InputError("Input volumes API returned an invalid volume name.")
+    return name
+
+
+def _object_key(entry: dict[str, Any]) -> str:
+    key = entry["key"]
+    if not isinstance(key, str):
+        raise InputError("Volume objects API returned an invalid object key.")
+    return key
+
+
+def _optional_str(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _decode_json(response: httpx.Response, error: str) -> Any:
+    """Decode a response body with orjson, mapping failures onto InputError."""
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+        raise InputError(error) from exc
+
+
+def _client(api: WalkAIAPIConfig) -> httpx.Client:
+    """Return a pooled HTTP client for the given API credentials.
+
+    Clients are cached per (url, pat) so chained calls in one CLI
+    invocation reuse a single TCP/TLS connection instead of paying a
+    fresh handshake per request.
+    """
+
+    key = (api.url, api.pat)
+    client = _clients.get(key)
+    if client is None:
+        client = httpx.Client(
+            base_url=_base_url(api),
+            headers=_auth_headers(api),
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+        _clients[key] = client
+    return client
+
+
 def list_input_volumes(
-    api: WalkAIAPIConfig, *, timeout: float = 30.0
+    api: WalkAIAPIConfig, *, timeout: float = 30.0, use_cache: bool = True
 ) -> list[dict[str, Any]]:
     """Fetch input volumes available to the user."""
 
-    endpoint = f"{_base_url(api)}/volumes/"
+    cache_key = (api.url, api.pat, "/volumes/?is_input")
+    if use_cache and (cached := _cached_listing(cache_key)) is not None:
+        return cached
+
+    etag_entry = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": etag_entry[0]} if etag_entry is not None else None
 
     try:
-        response = httpx.get(
-            endpoint,
-            headers=_auth_headers(api),
+        response = _client(api).get(
+            _VOLUMES_ENDPOINT,
             params={"is_input": True},
+            headers=headers,
             timeout=timeout,
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
         raise InputError(f"Failed to reach WalkAI API: {exc}") from exc
 
+    if response.status_code == 304 and etag_entry is not None:
+        volumes = etag_entry[1]
+        _store_listing(cache_key, volumes)
+        return volumes
+
     if response.status_code >= 400:
         detail = response.text.strip() or f"HTTP {response.status_code}"
         raise InputError(f"Failed to list input volumes: {detail}")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise InputError("Input volumes API returned invalid JSON.") from exc
+    payload = _decode_json(response, "Input volumes API returned invalid JSON.")
 
     if not isinstance(payload, list):
         raise InputError("Input volumes API returned an unexpected payload.")
 
-    volumes: list[dict[str, Any]] = []
-    for entry in payload:
-        if not isinstance(entry, dict):
-            raise InputError("Input volumes API returned an unexpected entry.")
-
-        try:
-            volume_id = int(entry["id"])
-        except (KeyError, TypeError, ValueError) as exc:
-            raise InputError(
-                "Input volumes API returned an invalid volume id."
-            ) from exc
-
-        name = entry.get("pvc_name") or entry.get("name")
-        if not isinstance(name, str) or not name.strip():
-            raise InputError("Input volumes API returned an invalid volume name.")
-
-        try:
-            size = int(entry["size"])
-        except (KeyError, TypeError, ValueError) as exc:
-            raise InputError(
-                "Input volumes API returned an invalid volume size."
-            ) from exc
-
-        volumes.append({"id": volume_id, "name": name, "size": size})
-
+    # One try around a comprehension keeps the per-entry work in C paths;
+    # InputError from the name helper propagates untouched.
+    try:
+        volumes = [
+            {
+                "id": int(entry["id"]),
+                "name": _volume_name(entry),
+                "size": int(entry["size"]),
+            }
+            for entry in payload
+        ]
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise InputError("Input volumes API returned an unexpected entry.") from exc
+
+    if etag := response.headers.get("etag"):
+        _etag_cache[cache_key] = (etag, volumes)
+    _store_listing(cache_key, volumes)
     return volumes
 
 
 def list_volume_objects(
-    api: WalkAIAPIConfig, *, volume_id: int, timeout: float = 30.0
+    api: WalkAIAPIConfig,
+    *,
+    volume_id: int,
+    timeout: float = 30.0,
+    use_cache: bool = True,
 ) -> list[dict[str, Any]]:
     """Fetch objects stored inside a volume."""
 
-    endpoint = f"{_base_url(api)}/volumes/{volume_id}/objects"
+    cache_key = (api.url, api.pat, f"/volumes/{volume_id}/objects")
+    if use_cache and (cached := _cached_listing(cache_key)) is not None:
+        return cached
+
+    etag_entry = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": etag_entry[0]} if etag_entry is not None else None
 
     try:
-        response = httpx.get(
-            endpoint,
-            headers=_auth_headers(api),
+        response = _client(api).get(
+            f"/volumes/{volume_id}/objects",
+            headers=headers,
             timeout=timeout,
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
         raise InputError(f"Failed to reach WalkAI API: {exc}") from exc
 
+    if response.status_code == 304 and etag_entry is not None:
+        objects = etag_entry[1]
+        _store_listing(cache_key, objects)
+        return objects
+
     if response.status_code == 404:
         raise InputError(f"Volume '{volume_id}' was not found.")
 
@@ -103,10 +218,7 @@ def list_volume_objects(
         detail = response.text.strip() or f"HTTP {response.status_code}"
         raise InputError(f"Failed to list volume objects: {detail}")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise InputError("Volume objects API returned invalid JSON.") from exc
+    payload = _decode_json(response, "Volume objects API returned invalid JSON.")
 
     if not isinstance(payload, dict):
         raise InputError("Volume objects API returned an unexpected payload.")
@@ -117,40 +229,24 @@ def list_volume_objects(
     if not isinstance(raw_objects, list):
         raise InputError("Volume objects API returned an unexpected objects payload.")
 
-    objects: list[dict[str, Any]] = []
-    for entry in raw_objects:
-        if not isinstance(entry, dict) or "key" not in entry:
-            raise InputError("Volume objects API returned an unexpected object entry.")
-
-        key = entry["key"]
-        if not isinstance(key, str):
-            raise InputError("Volume objects API returned an invalid object key.")
-
-        size_raw = entry.get("size")
-        try:
-            size = int(size_raw) if size_raw is not None else 0
-        except (TypeError, ValueError) as exc:
-            raise InputError(
-                "Volume objects API returned an invalid object size."
-            ) from exc
-
-        last_modified = entry.get("last_modified")
-        if last_modified is not None and not isinstance(last_modified, str):
-            last_modified = str(last_modified)
-
-        etag = entry.get("etag")
-        if etag is not None and not isinstance(etag, str):
-            etag = str(etag)
-
-        objects.append(
+    try:
+        objects = [
             {
-                "key": key,
-                "size": size,
-                "last_modified": last_modified,
-                "etag": etag,
+                "key": _object_key(entry),
+                "size": int(entry.get("size") or 0),
+                "last_modified": _optional_str(entry.get("last_modified")),
+                "etag": _optional_str(entry.get("etag")),
             }
-        )
+            for entry in raw_objects
+        ]
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise InputError(
+            "Volume objects API returned an unexpected object entry."
+        ) from exc
 
+    if etag := response.headers.get("etag"):
+        _etag_cache[cache_key] = (etag, objects)
+    _store_listing(cache_key, objects)
     return objects
 
 
@@ -162,14 +258,14 @@ def create_input_volume(
     if size <= 0:
         raise InputError("Input volume size must be greater than zero.")
 
-    endpoint = f"{_base_url(api)}/volumes/inputs"
-    payload = {"storage": size}
+    # orjson encodes the body faster than httpx's stdlib-json path.
+    body = orjson.dumps({"storage": size})
 
     try:
-        response = httpx.post(
-            endpoint,
-            json=payload,
-            headers=_auth_headers(api),
+        response = _client(api).post(
+            _VOLUME_INPUTS_ENDPOINT,
+            content=body,
+            headers={"Content-Type": "application/json"},
             timeout=timeout,
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
@@ -179,10 +275,9 @@ def create_input_volume(
         detail = response.text.strip() or f"HTTP {response.status_code}"
         raise InputError(f"Failed to create input volume: {detail}")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise InputError("Create input volume API returned invalid JSON.") from exc
+    payload = _decode_json(
+        response, "Create input volume API returned invalid JSON."
+    )
 
     if not isinstance(payload, dict):
         raise InputError("Create input volume API returned an unexpected payload.")
@@ -215,6 +310,12 @@ def create_input_volume(
     if key_prefix is not None and not isinstance(key_prefix, str):
         key_prefix = str(key_prefix)
 
+    # The cached input-volume listing no longer reflects reality; drop
+    # the TTL and ETag entries so the next list hits the API.
+    list_key = (api.url, api.pat, "/volumes/?is_input")
+    _list_cache.pop(list_key, None)
+    _etag_cache.pop(list_key, None)
+
     is_input = raw_volume.get("is_input")
     if is_input is not None:
         is_input = bool(is_input)
@@ -228,27 +329,54 @@ def create_input_volume(
     }
 
 
+# Cap on file names per presigned-URL request; larger uploads are split
+# so no single JSON body grows unbounded.
+_PRESIGNED_BATCH_SIZE = 500
+
+
 def request_input_upload_urls(
     api: WalkAIAPIConfig,
     *,
     volume_id: int,
     filenames: Iterable[str],
     timeout: float = 30.0,
+    batch_size: int = _PRESIGNED_BATCH_SIZE,
 ) -> list[str]:
-    """Request presigned URLs for uploading files to an input volume."""
+    """Request presigned URLs for uploading files to an input volume.
+
+    File names are sent in batches of ``batch_size`` and the resulting
+    URL lists concatenated, so the request count stays O(N/batch) while
+    individual request bodies stay small.
+    """
 
-    names = [name for name in filenames if name]
+    names = list(filter(None, filenames))
     if not names:
         raise InputError("At least one file name must be provided.")
 
-    endpoint = f"{_base_url(api)}/volumes/inputs/presigneds"
-    payload = {"volume_id": volume_id, "file_names": names}
+    if batch_size <= 0:
+        raise InputError("Presigned URL batch size must be greater than zero.")
+
+    urls: list[str] = []
+    for start in range(0, len(names), batch_size):
+        urls.extend(
+            _request_upload_urls_batch(
+                api, volume_id, names[start : start + batch_size], timeout
+            )
+        )
+    return urls
+
+
+def _request_upload_urls_batch(
+    api: WalkAIAPIConfig, volume_id: int, names: list[str], timeout: float
+) -> list[str]:
+    # Batches can carry hundreds of file names; orjson keeps the encode cheap.
+    body = orjson.dumps({"volume_id": volume_id, "file_names": names})
 
     try:
-        response = httpx.post(
-            endpoint,
-            json=payload,
-            headers=_auth_headers(api),
+        response = _client(api).post(
+            _PRESIGNEDS_ENDPOINT,
+            content=body,
+            headers={"Content-Type": "application/json"},
             timeout=timeout,
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
@@ -258,10 +386,9 @@ def request_input_upload_urls(
         detail = response.text.strip() or f"HTTP {response.status_code}"
         raise InputError(f"Failed to request upload URLs: {detail}")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise InputError("Request upload URLs API returned invalid JSON.") from exc
+    payload = _decode_json(
+        response, "Request upload URLs API returned invalid JSON."
+    )
 
     if not isinstance(payload, dict):
         raise InputError("Request upload URLs API returned an unexpected payload.")
@@ -274,47 +401,173 @@ def request_input_upload_urls(
             "Request upload URLs API returned an unexpected presigneds payload."
         )
 
-    urls: list[str] = []
-    for entry in presigneds:
-        if not isinstance(entry, str) or not entry.strip():
-            raise InputError(
-                "Request upload URLs API returned an invalid presigned URL."
-            )
-        urls.append(entry)
+    # Filter in one pass and compare lengths instead of branching per entry.
+    urls = [entry for entry in presigneds if isinstance(entry, str) and entry.strip()]
+    if len(urls) != len(presigneds):
+        raise InputError("Request upload URLs API returned an invalid presigned URL.")
 
     return urls
 
 
+# Presigned endpoints throttle aggressive clients; cap in-flight PUTs.
+_UPLOAD_CONCURRENCY = 8
+
+# Chunk size for streamed upload bodies.
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Transient PUT failures are retried this many times per file, both for
+# transport errors and 5xx responses, so one flaky upload costs only
+# that file instead of restarting the whole batch.
+_UPLOAD_RETRIES = 2
+
+
+def _matches_existing(path: Path, entry: dict[str, Any] | None) -> bool:
+    """Report whether a local file matches an already-uploaded object.
+
+    Only plain single-part ETags (an MD5 hex digest) are comparable; any
+    other shape is treated as a mismatch so the file is re-uploaded.
+    """
+
+    if entry is None:
+        return False
+
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    if size != entry.get("size"):
+        return False
+
+    etag = (entry.get("etag") or "").strip('"')
+    if len(etag) != 32:
+        return False
+
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "md5").hexdigest() == etag
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a file with OpenSSL's SHA-256 without loading it into memory."""
+
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+async def _iter_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Yield the file in fixed-size chunks so large bodies never sit in memory."""
+
+    with path.open("rb") as handle:
+        while chunk := handle.read(_UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+async def _upload_one(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    idx: int,
+    url: str,
+    path: Path,
+    timeout: float,
+) -> None:
+    """Upload a single file, mapping failures onto InputError.
+
+    Transport errors and 5xx responses are retried with a short
+    exponential backoff before giving up on the file.
+    """
+
+    async with semaphore:
+        try:
+            # An explicit Content-Length keeps the transfer non-chunked so
+            # the server can accept the body without extra buffering, and
+            # the payload hash lets S3-style endpoints verify integrity
+            # without a second server-side pass. The digest must be known
+            # before the body goes out, so hash in a worker thread first.
+            size = path.stat().st_size
+            digest = await asyncio.to_thread(_file_sha256, path)
+        except FileNotFoundError as exc:
+            raise InputError(f"File not found: {path}") from exc
+
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(size),
+            "x-amz-content-sha256": digest,
+        }
+        for attempt in range(_UPLOAD_RETRIES + 1):
+            try:
+                response = await client.put(
+                    url,
+                    content=_iter_file_chunks(path),
+                    headers=headers,
+                    timeout=timeout,
+                )
+            except httpx.RequestError as exc:
+                if attempt == _UPLOAD_RETRIES:
+                    raise InputError(
+                        f"Failed to upload file {path.name}: {exc}"
+                    ) from exc
+            else:
+                if response.status_code < 500 or attempt == _UPLOAD_RETRIES:
+                    break
+            await asyncio.sleep(0.25 * 2**attempt)
+
+    if response.status_code >= 400:
+        detail = response.text.strip() or f"HTTP {response.status_code}"
+        raise InputError(f"Upload failed for {path.name} (item {idx}): {detail}")
+
+
+async def _upload_all(urls: list[str], files: list[Path], timeout: float) -> None:
+    semaphore = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+    limits = httpx.Limits(max_connections=_UPLOAD_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, limits=limits) as client:
+        await asyncio.gather(
+            *(
+                _upload_one(client, semaphore, idx, url, path, timeout)
+                for idx, (url, path) in enumerate(
+                    zip(urls, files, strict=True), start=1
+                )
+            )
+        )
+
+
 def upload_files_to_presigned(
     urls: list[str],
     files: list[Path],
     *,
     timeout: float = 60.0,
+    existing: dict[str, dict[str, Any]] | None = None,
 ) -> None:
-    """Upload files to their corresponding presigned URLs."""
+    """Upload files to their corresponding presigned URLs.
+
+    Uploads are independent and I/O bound, so they run concurrently over
+    an async client with bounded parallelism. When ``existing`` maps
+    object keys to entries from :func:`list_volume_objects`, files whose
+    size and ETag already match are skipped entirely.
+    """
 
     if len(urls) != len(files):
         raise InputError(
             "The number of presigned URLs does not match the number of files."
         )
 
-    for idx, (url, path) in enumerate(zip(urls, files, strict=False), start=1):
+    for url in urls:
         if not isinstance(url, str) or not url.strip():
             raise InputError("Encountered an invalid presigned URL.")
 
-        try:
-            with path.open("rb") as handle:
-                response = httpx.put(
-                    url,
-                    content=handle,
-                    headers={"Content-Type": "application/octet-stream"},
-                    timeout=timeout,
-                )
-        except FileNotFoundError as exc:
-            raise InputError(f"File not found: {path}") from exc
-        except httpx.RequestError as exc:  # pragma: no cover - network failure guard
-            raise InputError(f"Failed to upload file {path.name}: {exc}") from exc
-
-        if response.status_code >= 400:
-            detail = response.text.strip() or f"HTTP {response.status_code}"
-            raise InputError(f"Upload failed for {path.name} (item {idx}): {detail}")
+    # Check every file before any bytes leave the machine, so a missing
+    # path aborts cleanly instead of failing after partial uploads.
+    for path in files:
+        if not path.is_file():
+            raise InputError(f"File not found: {path}")
+
+    if existing:
+        pending = [
+            (url, path)
+            for url, path in zip(urls, files, strict=True)
+            if not _matches_existing(path, existing.get(path.name))
+        ]
+        if not pending:
+            return
+        urls = [url for url, _ in pending]
+        files = [path for _, path in pending]
+
+    asyncio.run(_upload_all(urls, files, timeout))
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import time
+import uuid
 from collections.abc import Sequence
+from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
 import typer
 
-from walkai.build import BuildError, build_image
+if TYPE_CHECKING:
+    import httpx
+
 from walkai.configuration import (
     ConfigError,
     WalkAIAPIConfig,
@@ -19,29 +24,71 @@ from walkai.configuration import (
     load_config,
     save_config,
 )
-from walkai.inputs import (
-    InputError,
-    create_input_volume,
-    list_input_volumes,
-    list_volume_objects,
-    request_input_upload_urls,
-    upload_files_to_presigned,
-)
-from walkai.project import ProjectConfigError, load_project_config
-from walkai.push import PushError, fetch_registry_credentials, push_image
-from walkai.secrets import (
-    SecretsError,
-    create_secret,
-    delete_secret,
-    get_secret,
-    list_secrets,
-    parse_env_file,
-)
 
 from . import __version__
 
+# Heavier dependencies (httpx and the command-specific helper modules)
+# are imported inside the command bodies so cold starts such as
+# 'walkai --help' or 'walkai version' do not pay for their import graphs.
+
+class ContainerClient(str, Enum):
+    """Container clients supported by the push command."""
+
+    docker = "docker"
+    podman = "podman"
+
+
+# Transient submit failures are retried this many times, both at the
+# transport level (connection errors) and for 5xx responses.
+_SUBMIT_RETRIES = 3
+
+
+@functools.cache
+def _submit_client() -> "httpx.Client":
+    """Build the pooled client used for job submission once per process.
+
+    Repeated submits (CI loops, scripts) reuse the connection instead of
+    paying DNS + TCP + TLS per call, and the staged timeouts separate
+    connect, read/write, and pool acquisition failures.
+    """
+
+    import httpx
+
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=_SUBMIT_RETRIES),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+    )
+
+
+def _post_job(
+    url: str,
+    *,
+    json: dict[str, object],
+    headers: dict[str, str],
+    timeout: float,
+) -> "httpx.Response":
+    """POST a job submission, retrying transient failures.
+
+    Connection errors are retried by the transport; 5xx responses are
+    retried with a short exponential backoff. Callers should send an
+    Idempotency-Key header so the server can dedupe replayed POSTs.
+    """
+
+    client = _submit_client()
+    for attempt in range(_SUBMIT_RETRIES + 1):
+        response = client.post(url, json=json, headers=headers, timeout=timeout)
+        if response.status_code < 500 or attempt == _SUBMIT_RETRIES:
+            break
+        time.sleep(0.25 * 2**attempt)
+    return response
+
+
 app = typer.Typer(
-    help="Opinionated tooling to build and push Python apps for Kubernetes."
+    help="Opinionated tooling to build and push Python apps for Kubernetes.",
+    # Plain tracebacks keep rich out of the error path; helper errors are
+    # already rendered as red one-liners before they would reach it.
+    pretty_exceptions_enable=False,
 )
 secrets_app = typer.Typer(help="Manage WalkAI secrets.")
 app.add_typer(secrets_app, name="secrets")
@@ -49,8 +96,14 @@ inputs_app = typer.Typer(help="Manage WalkAI input volumes.")
 app.add_typer(inputs_app, name="input")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_api_config() -> WalkAIAPIConfig:
-    """Load the stored API configuration or exit with an error."""
+    """Load the stored API configuration or exit with an error.
+
+    The result is memoized so chained commands in one process do not
+    re-stat and re-parse the config file; the ``config`` command clears
+    the cache whenever it rewrites or deletes the stored credentials.
+    """
 
     try:
         stored_config = load_config()
@@ -69,9 +122,19 @@ def _load_api_config() -> WalkAIAPIConfig:
     return stored_config.walkai_api
 
 
+def _dump_json(payload: object) -> str:
+    """Serialize --json output with orjson; matches json.dumps(indent=2)."""
+
+    import orjson
+
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+
+
 def _parse_inline_pairs(pairs: Sequence[str]) -> dict[str, str]:
     """Parse KEY=VALUE pairs passed via the CLI."""
 
+    from walkai.secrets import SecretsError
+
     data: dict[str, str] = {}
     for raw in pairs:
         if "=" not in raw:
@@ -97,6 +160,8 @@ def secrets_list(
 ) -> None:
     """List the available secrets."""
 
+    from walkai.secrets import SecretsError, list_secrets
+
     walkai_api = _load_api_config()
 
     try:
@@ -106,7 +171,7 @@ def secrets_list(
         raise typer.Exit(code=1) from exc
 
     if json_output:
-        typer.echo(json.dumps(secrets, indent=2))
+        typer.echo(_dump_json(secrets))
         return
 
     if not secrets:
@@ -129,6 +194,8 @@ def secrets_get(
 ) -> None:
     """Fetch a single secret."""
 
+    from walkai.secrets import SecretsError, get_secret
+
     walkai_api = _load_api_config()
 
     try:
@@ -138,7 +205,7 @@ def secrets_get(
         raise typer.Exit(code=1) from exc
 
     if json_output:
-        typer.echo(json.dumps(secret, indent=2))
+        typer.echo(_dump_json(secret))
         return
 
     typer.secho(f"Secret: {secret['name']}", fg=typer.colors.CYAN)
@@ -177,6 +244,8 @@ def secrets_create(
 ) -> None:
     """Create a secret from CLI key/value pairs or a .env file."""
 
+    from walkai.secrets import SecretsError, create_secret, parse_env_file
+
     walkai_api = _load_api_config()
     merged: dict[str, str] = {}
 
@@ -233,6 +302,8 @@ def secrets_delete(
             typer.echo("Aborted.")
             raise typer.Exit()
 
+    from walkai.secrets import SecretsError, delete_secret
+
     walkai_api = _load_api_config()
 
     try:
@@ -251,19 +322,26 @@ def inputs_list(
         "--json",
         help="Print the raw JSON payload from the API.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the short-lived listing cache and query the API.",
+    ),
 ) -> None:
     """List available input volumes."""
 
+    from walkai.inputs import InputError, list_input_volumes
+
     walkai_api = _load_api_config()
 
     try:
-        volumes = list_input_volumes(walkai_api)
+        volumes = list_input_volumes(walkai_api, use_cache=not no_cache)
     except InputError as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
 
     if json_output:
-        typer.echo(json.dumps(volumes, indent=2))
+        typer.echo(_dump_json(volumes))
         return
 
     if not volumes:
@@ -283,19 +361,28 @@ def inputs_get(
         "--json",
         help="Print the raw JSON payload from the API.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the short-lived listing cache and query the API.",
+    ),
 ) -> None:
     """List the objects stored in an input volume."""
 
+    from walkai.inputs import InputError, list_volume_objects
+
     walkai_api = _load_api_config()
 
     try:
-        objects = list_volume_objects(walkai_api, volume_id=volume_id)
+        objects = list_volume_objects(
+            walkai_api, volume_id=volume_id, use_cache=not no_cache
+        )
     except InputError as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
 
     if json_output:
-        typer.echo(json.dumps(objects, indent=2))
+        typer.echo(_dump_json(objects))
         return
 
     if not objects:
@@ -342,6 +429,13 @@ def inputs_create(
         )
         raise typer.Exit(code=1)
 
+    from walkai.inputs import (
+        InputError,
+        create_input_volume,
+        request_input_upload_urls,
+        upload_files_to_presigned,
+    )
+
     walkai_api = _load_api_config()
 
     try:
@@ -389,6 +483,8 @@ def build(
 ) -> None:
     """Build a container image from"""
 
+    from walkai.build import BuildError, build_image
+
     try:
         built_image = build_image(
             project_dir=path,
@@ -439,6 +535,8 @@ def config(
             typer.secho(str(exc), err=True, fg=typer.colors.RED)
             raise typer.Exit(code=1) from exc
 
+        _load_api_config.cache_clear()
+
         if removed:
             typer.secho("WalkAI configuration deleted.", fg=typer.colors.GREEN)
         else:
@@ -458,9 +556,10 @@ def config(
         pat = typer.prompt("WalkAI personal access token", hide_input=True)
 
     config_model = WalkAIConfig(
-        walkai_api=WalkAIAPIConfig(url=api_url.strip(), pat=pat),  # type: ignore
+        walkai_api=WalkAIAPIConfig(url=api_url, pat=pat),
     )
     saved_path = save_config(config_model)
+    _load_api_config.cache_clear()
 
     typer.secho("WalkAI configuration saved.", fg=typer.colors.GREEN)
     if show_path:
@@ -470,8 +569,8 @@ def config(
 @app.command()
 def push(
     image: str = typer.Argument(..., help="Local image reference to push."),
-    client: str = typer.Option(
-        "docker",
+    client: ContainerClient = typer.Option(
+        ContainerClient.docker,
         "--client",
         help="Container client to use (docker or podman).",
         case_sensitive=False,
@@ -479,6 +578,8 @@ def push(
 ) -> None:
     """Push an image to the configured container registry."""
 
+    from walkai.push import PushError, fetch_registry_credentials, push_image
+
     try:
         stored_config = load_config()
     except ConfigError as exc:
@@ -493,13 +594,6 @@ def push(
         )
         raise typer.Exit(code=1)
 
-    normalised_client = client.lower().strip()
-    if normalised_client not in {"docker", "podman"}:
-        typer.secho(
-            "Client must be either 'docker' or 'podman'.", err=True, fg=typer.colors.RED
-        )
-        raise typer.Exit(code=1)
-
     walkai_api = stored_config.walkai_api
 
     try:
@@ -507,7 +601,7 @@ def push(
         remote_ref = push_image(
             local_image=image,
             credentials=credentials,
-            client=normalised_client,  # type: ignore[arg-type]
+            client=client.value,  # type: ignore[arg-type]
         )
     except PushError as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
@@ -558,6 +652,9 @@ def submit(
 ) -> None:
     """Submit a job to the WalkAI API."""
 
+    import httpx
+    import orjson
+
     try:
         cli_config = load_config()
     except ConfigError as exc:
@@ -574,8 +671,7 @@ def submit(
 
     walkai_api = cli_config.walkai_api
 
-    base_url = walkai_api.url.rstrip("/")
-    endpoint = f"{base_url}/jobs/"
+    endpoint = walkai_api.jobs_endpoint
 
     normalised_gpu = gpu.strip()
     if not normalised_gpu:
@@ -586,7 +682,7 @@ def submit(
         )
         raise typer.Exit(code=1)
 
-    payload = {
+    payload: dict[str, object] = {
         "image": image,
         "gpu": normalised_gpu,
         "storage": storage,
@@ -596,12 +692,12 @@ def submit(
     if input_id is not None:
         payload["input_id"] = input_id
 
-    headers = {
-        "Authorization": f"Bearer {walkai_api.pat}",
-    }
+    headers = walkai_api.auth_headers
+    # Lets the server dedupe the job if a retry replays the POST.
+    headers["Idempotency-Key"] = uuid.uuid4().hex
 
     try:
-        response = httpx.post(endpoint, json=payload, headers=headers, timeout=30)
+        response = _post_job(endpoint, json=payload, headers=headers, timeout=30)
     except httpx.RequestError as exc:
         typer.secho(f"Failed to reach WalkAI API: {exc}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
@@ -611,11 +707,13 @@ def submit(
         typer.secho(f"Job submission failed: {detail}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    job_reference: str | None = None
     try:
-        data = response.json()
-    except ValueError:
+        # orjson.JSONDecodeError subclasses ValueError.
+        data = orjson.loads(response.content)
+    except ValueError as exc:
         typer.secho("Job submission didn't emit a response", fg=typer.colors.YELLOW)
+        raise typer.Exit() from exc
+
     job_reference = data.get("job_id")
     pod_reference = data.get("pod")
 
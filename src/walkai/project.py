@@ -1,5 +1,6 @@
 """Utilities to inspect a target project's pyproject configuration."""
 
+import os
 import re
 import tomllib
 from pathlib import Path
@@ -9,6 +10,10 @@ class ProjectConfigError(RuntimeError):
     """Raised when the target pyproject.toml is missing required information."""
 
 
+# Compiled once; default_image runs this over the project name on every call.
+_IMAGE_NAME_RE = re.compile(r"[^a-z0-9_.-]+")
+
+
 class WalkAIProjectConfig:
     """Container build configuration extracted from tool.walkai."""
 
@@ -29,21 +34,44 @@ class WalkAIProjectConfig:
     def default_image(self) -> str:
         """Return an opinionated default image name for the project."""
 
-        sanitized = re.sub(r"[^a-z0-9_.-]+", "-", self.project_name.lower()).strip("-")
+        sanitized = _IMAGE_NAME_RE.sub("-", self.project_name.lower()).strip("-")
         base = sanitized or self.root.name.lower()
         return f"walkai/{base}:latest"
 
 
-def load_project_config(project_dir: Path) -> WalkAIProjectConfig:
-    """Read the walkai configuration from a project's pyproject.toml."""
+# Parsed configurations keyed on (project dir, pyproject mtime, validation
+# mode) so repeated builds of an unchanged project skip the TOML re-parse.
+_config_cache: dict[tuple[Path, int, bool], WalkAIProjectConfig] = {}
+
+
+def load_project_config(
+    project_dir: Path, *, validate_ignores: bool = True
+) -> WalkAIProjectConfig:
+    """Read the walkai configuration from a project's pyproject.toml.
 
-    project_dir = project_dir.resolve()
+    ``validate_ignores`` stats every declared ignore path; callers that
+    only need the parsed metadata can turn it off to skip that pass.
+    """
+
+    # Callers pass an already-resolved directory (Typer resolves CLI path
+    # arguments), so re-running the realpath syscall chain here is waste.
     pyproject_path = project_dir / "pyproject.toml"
-    if not pyproject_path.exists():
-        raise ProjectConfigError(f"No pyproject.toml found at {pyproject_path}.")
+    # One stat serves both the existence check and the cache key.
+    try:
+        mtime_ns = pyproject_path.stat().st_mtime_ns
+    except FileNotFoundError as exc:
+        raise ProjectConfigError(
+            f"No pyproject.toml found at {pyproject_path}."
+        ) from exc
+
+    cache_key = (project_dir, mtime_ns, validate_ignores)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        document = tomllib.loads(pyproject_path.read_text())
+        with pyproject_path.open("rb") as fp:
+            document = tomllib.load(fp)
     except tomllib.TOMLDecodeError as exc:  # type: ignore[attr-defined]
         raise ProjectConfigError(f"Failed to parse {pyproject_path}: {exc}") from exc
 
@@ -83,18 +111,24 @@ def load_project_config(project_dir: Path) -> WalkAIProjectConfig:
             raise ProjectConfigError(
                 "The 'ignore' field must be a list of relative paths if provided."
             )
+        # The project dir is already resolved, so a textual join + normpath
+        # is enough; Path.resolve() would re-stat every path segment per
+        # entry just to chase symlinks we do not support in ignore lists.
+        root_str = str(project_dir)
         for item in ignore_value:
-            resolved = (project_dir / item).resolve()
-            if not resolved.exists():
+            joined = os.path.normpath(os.path.join(root_str, item))
+            if validate_ignores and not os.path.exists(joined):
                 raise ProjectConfigError(
-                    f"Ignored path declared at {resolved} does not exist."
+                    f"Ignored path declared at {joined} does not exist."
                 )
-            ignored_paths.append(resolved)
+            ignored_paths.append(Path(joined))
 
-    return WalkAIProjectConfig(
+    config = WalkAIProjectConfig(
         project_name=project_name,
         entrypoint=entrypoint.strip(),
         os_dependencies=tuple(dep.strip() for dep in os_dependencies),
         root=project_dir,
         ignore=tuple(ignored_paths),
     )
+    _config_cache[cache_key] = config
+    return config
@@ -1,11 +1,18 @@
 """Support for pushing images to a registry."""
 
+import atexit
 import base64
+import functools
+import json
+import os
 import subprocess
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal
 
 import httpx
+import orjson
 
 from walkai.configuration import WalkAIAPIConfig
 
@@ -26,6 +33,15 @@ class RegistryCredentials:
     password: str
 
 
+@functools.cache
+def _client() -> httpx.Client:
+    """Shared HTTP client so repeated credential fetches reuse connections."""
+
+    client = httpx.Client(http2=True, timeout=30)
+    atexit.register(client.close)
+    return client
+
+
 def fetch_registry_credentials(api_config: WalkAIAPIConfig) -> RegistryCredentials:
     """Request short-lived registry credentials from the WalkAI API."""
 
@@ -34,7 +50,7 @@ def fetch_registry_credentials(api_config: WalkAIAPIConfig) -> RegistryCredentia
     headers = {"Authorization": f"Bearer {api_config.pat}"}
 
     try:
-        response = httpx.get(endpoint, headers=headers, timeout=30)
+        response = _client().get(endpoint, headers=headers)
     except httpx.RequestError as exc:
         raise PushError(f"Failed to reach WalkAI API: {exc}") from exc
 
@@ -43,8 +59,8 @@ def fetch_registry_credentials(api_config: WalkAIAPIConfig) -> RegistryCredentia
         raise PushError(f"Failed to obtain registry credentials: {detail}")
 
     try:
-        payload = response.json()
-    except ValueError as exc:
+        payload = orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
         raise PushError("WalkAI API returned malformed registry credentials.") from exc
 
     decoded = base64.b64decode(payload["token"]).decode("utf-8")
@@ -67,10 +83,8 @@ def normalise_registry_host(value: str) -> str:
     """Normalise the registry URL so it can be used with docker/podman."""
 
     cleaned = value.strip()
-    if cleaned.startswith("https://"):
-        cleaned = cleaned.removeprefix("https://")
-    elif cleaned.startswith("http://"):
-        cleaned = cleaned.removeprefix("http://")
+    if cleaned.startswith(("https://", "http://")):
+        cleaned = cleaned.split("://", 1)[1]
 
     return cleaned.rstrip("/")
 
@@ -87,11 +101,22 @@ def push_image(
     """
 
     remote_ref = credentials.url
+    registry_host = normalise_registry_host(credentials.url).split("/", 1)[0]
 
     try:
-        _login(client, credentials)
-        remote_ref = _tag(client, local_image, credentials.url)
-        _push(client, remote_ref)
+        logged_in = _is_logged_in(client, registry_host)
+        if not logged_in:
+            _login(client, credentials)
+        try:
+            remote_ref = _tag(client, local_image, credentials.url)
+            _push(client, remote_ref)
+        except subprocess.CalledProcessError:
+            if not logged_in:
+                raise
+            # The cached login may have expired; retry once after a fresh one.
+            _login(client, credentials)
+            remote_ref = _tag(client, local_image, credentials.url)
+            _push(client, remote_ref)
     except subprocess.CalledProcessError as exc:
         raise PushError(
             f"{client} command failed with exit code {exc.returncode}."
@@ -104,6 +129,40 @@ def push_image(
     return remote_ref
 
 
+def _auth_config_paths(client: ContainerClient) -> tuple[Path, ...]:
+    """Auth config files the client consults, in lookup order."""
+
+    docker_config = Path.home() / ".docker" / "config.json"
+    if client == "podman":
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            return (Path(runtime_dir) / "containers" / "auth.json", docker_config)
+
+    return (docker_config,)
+
+
+def _is_logged_in(client: ContainerClient, host: str) -> bool:
+    """Whether the client already holds credentials for the registry host.
+
+    'docker login' hits the registry on every call, so skipping it when
+    the auth config already lists the host saves a network round-trip on
+    warm pushes. A stale entry is handled by the retry in push_image.
+    """
+
+    for config_file in _auth_config_paths(client):
+        try:
+            with config_file.open("rb") as fp:
+                payload = json.load(fp)
+        except (OSError, ValueError):
+            continue
+
+        auths = payload.get("auths")
+        if isinstance(auths, dict) and auths.get(host):
+            return True
+
+    return False
+
+
 def _login(client: ContainerClient, credentials: RegistryCredentials) -> None:
     command = [
         client,
@@ -172,4 +231,23 @@ def _tag(client: ContainerClient, local: str, remote: str) -> str:
 
 
 def _push(client: ContainerClient, remote: str) -> None:
-    subprocess.run([client, "push", remote], check=True)
+    """Run the push, relaying client output line by line as it arrives.
+
+    Pushes can run for minutes on large images; streaming keeps progress
+    visible instead of buffering it until the subprocess exits.
+    """
+
+    command = [client, "push", remote]
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    with process:
+        for line in process.stdout or ():
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import re
+import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from walkai.configuration import WalkAIAPIConfig
 
@@ -22,34 +28,131 @@ def _auth_headers(api: WalkAIAPIConfig) -> dict[str, str]:
     return {"Authorization": f"Bearer {api.pat}"}
 
 
+_SECRETS_ENDPOINT = "/secrets/"
+
+_clients: dict[tuple[str, str], httpx.Client] = {}
+
+
+def _close_clients() -> None:  # pragma: no cover - process teardown
+    for client in _clients.values():
+        client.close()
+
+
+atexit.register(_close_clients)
+
+
+# Reads change slowly, so parsed results are kept briefly in-process;
+# chained commands within the TTL skip the round-trip entirely.
+_CACHE_TTL = 60.0
+
+_read_cache: dict[tuple[str, str, str], tuple[float, Any]] = {}
+
+
+def _cached_payload(key: tuple[str, str, str]) -> Any | None:
+    entry = _read_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_payload(key: tuple[str, str, str], value: Any) -> None:
+    _read_cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+# Last ETag and parsed payload per endpoint, so expired TTL entries can
+# be revalidated with If-None-Match instead of re-downloading the body.
+_etag_cache: dict[tuple[str, str, str], tuple[str, Any]] = {}
+
+
+def invalidate_secret(api: WalkAIAPIConfig, name: str) -> None:
+    """Drop cached reads made stale by a mutation of ``name``.
+
+    Both the listing and the per-secret entry are evicted, TTL and ETag
+    alike, so a get or list after a create/delete in the same process
+    hits the API instead of serving the pre-mutation payload.
+    """
+
+    for endpoint in (_SECRETS_ENDPOINT, f"/secrets/{name}"):
+        key = (api.url, api.pat, endpoint)
+        _read_cache.pop(key, None)
+        _etag_cache.pop(key, None)
+
+
+def _client(api: WalkAIAPIConfig) -> httpx.Client:
+    """Return a pooled HTTP client for the given API credentials.
+
+    Clients are cached per (url, pat) so chained calls in one CLI
+    invocation reuse a single TCP/TLS connection instead of paying a
+    fresh handshake per request.
+    """
+
+    key = (api.url, api.pat)
+    client = _clients.get(key)
+    if client is None:
+        client = httpx.Client(
+            base_url=_base_url(api),
+            headers=_auth_headers(api),
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+        _clients[key] = client
+    return client
+
+
+def _decode_json(response: httpx.Response, error: str) -> Any:
+    """Decode a response body with orjson, mapping failures onto SecretsError."""
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+        raise SecretsError(error) from exc
+
+
 def _handle_response_error(
     response: httpx.Response, action: str, *, default: str | None = None
 ) -> None:
     if response.status_code < 400:
         return
 
-    detail = response.text.strip() or default or f"HTTP {response.status_code}"
+    # Decode the raw bytes directly; .text would run charset detection
+    # on every error body just to check whether it is non-empty.
+    body = response.content.decode("utf-8", errors="replace").strip()
+    detail = body or default or f"HTTP {response.status_code}"
     raise SecretsError(f"{action}: {detail}")
 
 
 def list_secrets(
-    api: WalkAIAPIConfig, *, timeout: float = 30.0
+    api: WalkAIAPIConfig, *, timeout: float = 30.0, use_cache: bool = True
 ) -> list[dict[str, Any]]:
     """Fetch the available secrets."""
 
-    endpoint = f"{_base_url(api)}/secrets/"
+    cache_key = (api.url, api.pat, _SECRETS_ENDPOINT)
+    if use_cache and (cached := _cached_payload(cache_key)) is not None:
+        return cached
+
+    etag_entry = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": etag_entry[0]} if etag_entry is not None else None
 
     try:
-        response = httpx.get(endpoint, headers=_auth_headers(api), timeout=timeout)
+        response = _client(api).get(
+            _SECRETS_ENDPOINT, headers=headers, timeout=timeout
+        )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
         raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
 
+    if response.status_code == 304 and etag_entry is not None:
+        secrets = etag_entry[1]
+        _store_payload(cache_key, secrets)
+        return secrets
+
     _handle_response_error(response, "Failed to list secrets")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SecretsError("Secrets API returned invalid JSON.") from exc
+    payload = _decode_json(response, "Secrets API returned invalid JSON.")
 
     if not isinstance(payload, list):
         raise SecretsError("Secrets API returned an unexpected payload.")
@@ -59,6 +162,10 @@ def list_secrets(
         if not isinstance(entry, dict) or "name" not in entry:
             raise SecretsError("Secrets API returned an unexpected entry.")
         validated.append({"name": str(entry["name"])})
+
+    if etag := response.headers.get("etag"):
+        _etag_cache[cache_key] = (etag, validated)
+    _store_payload(cache_key, validated)
     return validated
 
 
@@ -67,29 +174,46 @@ def get_secret(
     *,
     name: str,
     timeout: float = 30.0,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Fetch a single secret by name."""
 
-    endpoint = f"{_base_url(api)}/secrets/{name}"
+    cache_key = (api.url, api.pat, f"/secrets/{name}")
+    if use_cache and (cached := _cached_payload(cache_key)) is not None:
+        return cached
+
+    etag_entry = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": etag_entry[0]} if etag_entry is not None else None
 
     try:
-        response = httpx.get(
-            endpoint,
-            headers=_auth_headers(api),
-            timeout=timeout,
+        response = _client(api).get(
+            f"/secrets/{name}", headers=headers, timeout=timeout
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
         raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
 
+    if response.status_code == 304 and etag_entry is not None:
+        secret = etag_entry[1]
+        _store_payload(cache_key, secret)
+        return secret
+
+    secret = _secret_from_response(response, name)
+
+    if etag := response.headers.get("etag"):
+        _etag_cache[cache_key] = (etag, secret)
+    _store_payload(cache_key, secret)
+    return secret
+
+
+def _secret_from_response(response: httpx.Response, name: str) -> dict[str, Any]:
+    """Validate a single-secret response, shared by the sync and bulk paths."""
+
     if response.status_code == 404:
         raise SecretsError(f"Secret '{name}' was not found.")
 
     _handle_response_error(response, "Failed to fetch secret")
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        raise SecretsError("Secrets API returned invalid JSON.") from exc
+    payload = _decode_json(response, "Secrets API returned invalid JSON.")
 
     if not isinstance(payload, dict):
         raise SecretsError("Secrets API returned an unexpected payload.")
@@ -108,6 +232,62 @@ def get_secret(
     return {"name": str(secret_name), "keys": keys}
 
 
+# The secrets API is light; cap in-flight bulk requests all the same.
+_BULK_CONCURRENCY = 8
+
+
+async def _afetch_secret(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    name: str,
+    timeout: float,
+) -> dict[str, Any]:
+    async with semaphore:
+        try:
+            response = await client.get(f"/secrets/{name}", timeout=timeout)
+        except httpx.RequestError as exc:  # pragma: no cover - network failure guard
+            raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
+
+    return _secret_from_response(response, name)
+
+
+async def _afetch_secrets(
+    api: WalkAIAPIConfig, names: list[str], timeout: float
+) -> list[dict[str, Any]]:
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+    limits = httpx.Limits(max_connections=_BULK_CONCURRENCY)
+    async with httpx.AsyncClient(
+        base_url=_base_url(api),
+        headers=_auth_headers(api),
+        http2=True,
+        limits=limits,
+    ) as client:
+        return list(
+            await asyncio.gather(
+                *(_afetch_secret(client, semaphore, name, timeout) for name in names)
+            )
+        )
+
+
+def get_secrets_bulk(
+    api: WalkAIAPIConfig,
+    *,
+    names: Iterable[str],
+    timeout: float = 30.0,
+) -> list[dict[str, Any]]:
+    """Fetch several secrets concurrently, in the order given.
+
+    The fetches are independent and I/O bound, so they run over one
+    multiplexed async client instead of paying a round-trip each.
+    """
+
+    pending = list(names)
+    if not pending:
+        return []
+
+    return asyncio.run(_afetch_secrets(api, pending, timeout))
+
+
 def create_secret(
     api: WalkAIAPIConfig,
     *,
@@ -117,68 +297,156 @@ def create_secret(
 ) -> None:
     """Create or replace a secret."""
 
-    endpoint = f"{_base_url(api)}/secrets/"
-    payload = {"name": name, "data": data}
+    # Serialize with orjson instead of letting httpx run the payload
+    # through stdlib json; for env-dump sized secrets the difference is
+    # measurable.
+    content = orjson.dumps({"name": name, "data": data})
 
     try:
-        response = httpx.post(
-            endpoint,
-            json=payload,
-            headers=_auth_headers(api),
+        response = _client(api).post(
+            _SECRETS_ENDPOINT,
+            content=content,
+            headers={"Content-Type": "application/json"},
             timeout=timeout,
         )
     except httpx.RequestError as exc:  # pragma: no cover - network failure guard
         raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
 
     _handle_response_error(response, "Failed to create secret")
+    invalidate_secret(api, name)
 
 
-def delete_secret(api: WalkAIAPIConfig, *, name: str, timeout: float = 30.0) -> None:
-    """Delete an existing secret."""
+async def _acreate_secret(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    name: str,
+    data: dict[str, str],
+    timeout: float,
+) -> None:
+    async with semaphore:
+        try:
+            response = await client.post(
+                _SECRETS_ENDPOINT,
+                content=orjson.dumps({"name": name, "data": data}),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network failure guard
+            raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
 
-    endpoint = f"{_base_url(api)}/secrets/{name}"
+    _handle_response_error(response, f"Failed to create secret '{name}'")
 
-    try:
-        response = httpx.delete(
-            endpoint,
-            headers=_auth_headers(api),
-            timeout=timeout,
+
+async def _acreate_secrets(
+    api: WalkAIAPIConfig,
+    items: list[tuple[str, dict[str, str]]],
+    timeout: float,
+) -> None:
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+    limits = httpx.Limits(max_connections=_BULK_CONCURRENCY)
+    async with httpx.AsyncClient(
+        base_url=_base_url(api),
+        headers=_auth_headers(api),
+        http2=True,
+        limits=limits,
+    ) as client:
+        await asyncio.gather(
+            *(
+                _acreate_secret(client, semaphore, name, data, timeout)
+                for name, data in items
+            )
         )
-    except httpx.RequestError as exc:  # pragma: no cover - network failure guard
-        raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
 
-    if response.status_code == 204:
+
+def create_secrets_bulk(
+    api: WalkAIAPIConfig,
+    *,
+    items: Iterable[tuple[str, dict[str, str]]],
+    timeout: float = 30.0,
+) -> None:
+    """Create or replace several secrets concurrently.
+
+    Counterpart to :func:`get_secrets_bulk` for scripts that seed many
+    secrets at once; should the server grow a batch endpoint, only this
+    function needs to change.
+    """
+
+    pending = list(items)
+    if not pending:
         return
 
-    _handle_response_error(
-        response, "Failed to delete secret", default="Secret not found."
-    )
+    asyncio.run(_acreate_secrets(api, pending, timeout))
 
+    for name, _ in pending:
+        invalidate_secret(api, name)
 
-def parse_env_file(path: Path) -> dict[str, str]:
-    """Parse a .env style file into a dictionary."""
 
-    data: dict[str, str] = {}
-    for idx, raw_line in enumerate(path.read_text().splitlines(), start=1):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+def delete_secret(api: WalkAIAPIConfig, *, name: str, timeout: float = 30.0) -> None:
+    """Delete an existing secret."""
+
+    try:
+        response = _client(api).delete(f"/secrets/{name}", timeout=timeout)
+    except httpx.RequestError as exc:  # pragma: no cover - network failure guard
+        raise SecretsError(f"Failed to reach WalkAI API: {exc}") from exc
+
+    if response.status_code != 204:
+        _handle_response_error(
+            response, "Failed to delete secret", default="Secret not found."
+        )
+
+    invalidate_secret(api, name)
 
-        if line.lower().startswith("export "):
-            line = line[7:].lstrip()
 
-        if "=" not in line:
-            raise SecretsError(f"Invalid line {idx} in {path}: missing '='.")
+# Matches the common KEY=value shapes in one C-level pass; anything the
+# pattern rejects (comments, blanks, unusual keys, malformed lines) goes
+# through the character-level slow path below, which also raises the
+# precise parse errors.
+_ENV_LINE_RE = re.compile(
+    r"\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"
+    r"(?:\"([^\"]*)\"|'([^']*)'|(.*?))\s*"
+)
 
-        key, value = line.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise SecretsError(f"Invalid line {idx} in {path}: missing key.")
 
-        value = value.strip()
-        if value and value[0] in {"'", '"'} and value[-1:] == value[0]:
-            value = value[1:-1]
+def parse_env_file(path: Path) -> dict[str, str]:
+    """Parse a .env style file into a dictionary."""
 
-        data[key] = value
+    data: dict[str, str] = {}
+    # Iterate the handle directly so large env files are never fully
+    # materialised as one string plus a list of lines.
+    with path.open("r", encoding="utf-8") as fp:
+        for idx, raw_line in enumerate(fp, start=1):
+            if match := _ENV_LINE_RE.fullmatch(raw_line):
+                key, double_quoted, single_quoted, bare = match.groups()
+                if double_quoted is not None:
+                    value = double_quoted
+                elif single_quoted is not None:
+                    value = single_quoted
+                else:
+                    value = bare
+                    if value and value[0] in {"'", '"'} and value[-1] == value[0]:
+                        value = value[1:-1]
+                data[key] = value
+                continue
+
+            line = raw_line.strip()
+            if not line or line[0] == "#":
+                continue
+
+            if line.lower().startswith("export "):
+                line = line[7:].lstrip()
+
+            if "=" not in line:
+                raise SecretsError(f"Invalid line {idx} in {path}: missing '='.")
+
+            key, value = line.split("=", 1)
+            key = key.strip()
+            if not key:
+                raise SecretsError(f"Invalid line {idx} in {path}: missing key.")
+
+            value = value.strip()
+            if value and value[0] in {"'", '"'} and value[-1:] == value[0]:
+                value = value[1:-1]
+
+            data[key] = value
 
     return data
@@ -0,0 +1,87 @@
+"""Shared fixtures for the walkai test suite."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from walkai import configuration, inputs, main, push, secrets
+from walkai.configuration import WalkAIAPIConfig, WalkAIConfig
+
+
+@pytest.fixture()
+def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the configuration helpers at a temporary file."""
+
+    config_dir = tmp_path / "config"
+    monkeypatch.setattr(configuration, "_config_dir", lambda: config_dir)
+    return config_dir / "config.toml"
+
+
+# Built once for the whole run; saved_config only serializes it, and tests
+# read it back through the file round-trip, so sharing the instance is safe.
+_CANONICAL_CONFIG = WalkAIConfig(
+    walkai_api=WalkAIAPIConfig(
+        url="https://api.walkai.ai",
+        pat="pat-token",
+    ),
+)
+
+
+@pytest.fixture()
+def saved_config(isolated_config: Path) -> Path:
+    """Store canonical API credentials in the isolated config file."""
+
+    configuration.save_config(_CANONICAL_CONFIG)
+    return isolated_config
+
+
+_PROJECT_TOML = b"""\
+[project]
+name = "demo"
+[tool.walkai]
+entrypoint = "python main.py"
+os_dependencies = []
+"""
+
+
+@pytest.fixture(scope="session")
+def demo_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal walkai project shared by tests that never mutate it.
+
+    Session scope writes the project files once for the whole run; tests
+    that modify project files must build their own tree under tmp_path.
+    """
+
+    project_dir = tmp_path_factory.mktemp("demo-src") / "demo"
+    project_dir.mkdir()
+    # The submit command only parses pyproject.toml; no test executes the
+    # entrypoint, so the project ships without a main.py.
+    (project_dir / "pyproject.toml").write_bytes(_PROJECT_TOML)
+    return project_dir
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches() -> Iterator[None]:
+    """Clear per-process caches between tests.
+
+    Each test points the configuration helpers at its own temporary
+    directory and fakes its own API responses, so cached results from an
+    earlier test must not leak.
+    """
+
+    main._load_api_config.cache_clear()
+    main._submit_client.cache_clear()
+    push._client.cache_clear()
+    inputs._list_cache.clear()
+    inputs._etag_cache.clear()
+    secrets._read_cache.clear()
+    secrets._etag_cache.clear()
+    yield
+    main._load_api_config.cache_clear()
+    main._submit_client.cache_clear()
+    push._client.cache_clear()
+    inputs._list_cache.clear()
+    inputs._etag_cache.clear()
+    secrets._read_cache.clear()
+    secrets._etag_cache.clear()
@@ -1,5 +1,6 @@
 """Tests for the walkai.build helpers."""
 
+import io
 import tomllib
 from pathlib import Path
 
@@ -9,6 +10,20 @@ import walkai.build as build
 from walkai.build import BuildError
 
 
+class DummyProcess:
+    """Minimal stand-in for the pack Popen handle."""
+
+    def __init__(self, returncode: int = 0, output: str = "") -> None:
+        self.stdout = io.StringIO(output)
+        self.returncode = returncode
+
+    def __enter__(self) -> "DummyProcess":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
 @pytest.fixture
 def project_factory(tmp_path: Path):
     """Return a helper that creates a minimal walkai project."""
@@ -90,10 +105,11 @@ def test_build_image_runs_pack_with_default_image(
 
     captured: dict[str, list[str]] = {}
 
-    def fake_run(cmd: list[str], *, check: bool) -> None:  # type: ignore[override]
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
         captured["cmd"] = cmd
+        return DummyProcess()
 
-    monkeypatch.setattr(build.subprocess, "run", fake_run)
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
 
     result = build.build_image(project_dir)
 
@@ -111,10 +127,10 @@ def test_build_image_rejects_existing_project_descriptor(
     project_dir = project_factory(os_dependencies=["git"])
     (project_dir / "project.toml").write_text("already here\n")
 
-    def fake_run(cmd: list[str], *, check: bool) -> None:  # type: ignore[override]
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
         raise AssertionError("pack should not start when project.toml exists")
 
-    monkeypatch.setattr(build.subprocess, "run", fake_run)
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
 
     with pytest.raises(BuildError, match="project.toml"):
         build.build_image(project_dir)
@@ -125,26 +141,108 @@ def test_build_image_returns_custom_image(
 ) -> None:
     project_dir = project_factory()
 
-    monkeypatch.setattr(build.subprocess, "run", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        build.subprocess, "Popen", lambda *args, **kwargs: DummyProcess()
+    )
 
     result = build.build_image(project_dir, image="custom/image:tag")
     assert result == "custom/image:tag"
 
 
+def test_build_image_skips_staging_when_redundant(
+    monkeypatch: pytest.MonkeyPatch, project_factory
+) -> None:
+    project_dir = project_factory()
+    (project_dir / "Procfile").write_text("entrypoint: python main.py\n")
+
+    captured: dict[str, list[str]] = {}
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
+        captured["cmd"] = cmd
+        return DummyProcess()
+
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
+
+    build.build_image(project_dir)
+
+    path_index = captured["cmd"].index("--path") + 1
+    assert Path(captured["cmd"][path_index]) == project_dir
+
+
+def test_build_image_raises_when_pack_fails(
+    monkeypatch: pytest.MonkeyPatch, project_factory
+) -> None:
+    project_dir = project_factory()
+
+    monkeypatch.setattr(
+        build.subprocess, "Popen", lambda *args, **kwargs: DummyProcess(returncode=3)
+    )
+
+    with pytest.raises(BuildError, match="exit code 3"):
+        build.build_image(project_dir)
+
+
+def test_build_image_leaves_project_procfile_untouched(
+    monkeypatch: pytest.MonkeyPatch, project_factory
+) -> None:
+    project_dir = project_factory()
+    procfile = project_dir / "Procfile"
+    procfile.write_text("web: gunicorn app:app\n")
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
+        path_index = cmd.index("--path") + 1
+        build_path = Path(cmd[path_index])
+        staged = (build_path / "Procfile").read_text()
+        assert staged == "entrypoint: python main.py\n"
+        return DummyProcess()
+
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
+
+    build.build_image(project_dir)
+
+    # The staging directory lives next to the project, so files are
+    # hardlinked; the synthesized Procfile must not write through a link
+    # back into the source tree.
+    assert procfile.read_text() == "web: gunicorn app:app\n"
+
+
+def test_build_image_honours_ignore_file_patterns(
+    monkeypatch: pytest.MonkeyPatch, project_factory
+) -> None:
+    project_dir = project_factory()
+    (project_dir / ".packignore").write_text("*.log\nnode_modules/\n")
+    (project_dir / "debug.log").write_text("noise\n")
+    (project_dir / "node_modules").mkdir()
+    (project_dir / "node_modules" / "pkg.js").write_text("module\n")
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
+        path_index = cmd.index("--path") + 1
+        build_path = Path(cmd[path_index])
+        assert (build_path / "main.py").exists()
+        assert not (build_path / "debug.log").exists()
+        assert not (build_path / "node_modules").exists()
+        return DummyProcess()
+
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
+
+    build.build_image(project_dir)
+
+
 def test_build_image_excludes_declared_ignore_paths(
     monkeypatch: pytest.MonkeyPatch, project_factory
 ) -> None:
     project_dir = project_factory(ignore={"datasets/sample.txt": "data"})
     (project_dir / "other.txt").write_text("keep\n")
 
-    def fake_run(cmd: list[str], *, check: bool) -> None:  # type: ignore[override]
+    def fake_popen(cmd: list[str], **kwargs: object) -> DummyProcess:
         path_index = cmd.index("--path") + 1
         build_path = Path(cmd[path_index])
         assert (build_path / "main.py").exists()
         assert not (build_path / "datasets" / "sample.txt").exists()
         # Ensure non-ignored files remain
         assert (build_path / "other.txt").exists()
+        return DummyProcess()
 
-    monkeypatch.setattr(build.subprocess, "run", fake_run)
+    monkeypatch.setattr(build.subprocess, "Popen", fake_popen)
 
     build.build_image(project_dir)
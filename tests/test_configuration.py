@@ -18,10 +18,8 @@ def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
     """Point the configuration module at a temporary config location."""
 
     config_dir = tmp_path / "config"
-    config_file = config_dir / "config.toml"
-    monkeypatch.setattr(configuration, "_CONFIG_DIR", config_dir)
-    monkeypatch.setattr(configuration, "_CONFIG_FILE", config_file)
-    return config_file
+    monkeypatch.setattr(configuration, "_config_dir", lambda: config_dir)
+    return config_dir / "config.toml"
 
 
 def test_delete_config_returns_false_when_missing(isolated_config: Path) -> None:
@@ -49,6 +47,7 @@ def test_save_and_load_round_trip(isolated_config: Path) -> None:
 
     saved_path = configuration.save_config(config)
     assert saved_path == isolated_config
+    assert not isolated_config.with_suffix(".tmp").exists()
     assert "[walkai]" in isolated_config.read_text()
     assert 'api_url = "https://api.walkai.ai/v1"' in isolated_config.read_text()
     loaded = configuration.load_config()
@@ -56,6 +55,13 @@ def test_save_and_load_round_trip(isolated_config: Path) -> None:
     assert loaded.walkai_api == config.walkai_api
 
 
+def test_api_config_strips_url_on_construction() -> None:
+    config = WalkAIAPIConfig(url="  https://api.walkai.ai  ", pat=" pat ")
+
+    assert config.url == "https://api.walkai.ai"
+    assert config.pat == " pat "
+
+
 def test_load_config_returns_none_when_missing(isolated_config: Path) -> None:
     assert configuration.load_config() is None
 
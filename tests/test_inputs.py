@@ -1,12 +1,17 @@
 """Tests for input volume helpers and CLI commands."""
 
+import hashlib
+import json
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 import pytest
 from typer.testing import CliRunner
 
-from walkai import configuration
-from walkai.configuration import WalkAIAPIConfig, WalkAIConfig
+import walkai.inputs as inputs
+from walkai.configuration import WalkAIAPIConfig
 from walkai.inputs import (
     InputError,
     create_input_volume,
@@ -20,37 +25,39 @@ from walkai.main import app
 runner = CliRunner()
 
 
-@pytest.fixture()
-def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
-    """Point the configuration helpers at a temporary file."""
+class DummyClient:
+    """Stands in for the pooled httpx client used by the helpers."""
 
-    config_dir = tmp_path / "config"
-    config_file = config_dir / "config.toml"
-    monkeypatch.setattr(configuration, "_CONFIG_DIR", config_dir)
-    monkeypatch.setattr(configuration, "_CONFIG_FILE", config_file)
-    return config_file
+    def __init__(self, response: object) -> None:
+        self.response = response
+        self.calls: list[dict[str, Any]] = []
 
+    def get(self, url: str, **kwargs: object) -> object:
+        self.calls.append({"method": "get", "url": url, **kwargs})
+        return self.response
 
-def _save_config() -> None:
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
+    def post(self, url: str, **kwargs: object) -> object:
+        self.calls.append({"method": "post", "url": url, **kwargs})
+        return self.response
 
 
-def test_list_input_volumes_requests_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, object] = {}
+def test_client_is_configured_once_per_credentials() -> None:
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai/", pat="pat")
 
+    client = inputs._client(api_config)
+
+    assert str(client.base_url) == "https://api.walkai.ai"
+    assert client.headers["Authorization"] == "Bearer pat"
+    assert inputs._client(api_config) is client
+
+
+def test_list_input_volumes_requests_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyResponse:
         status_code = 200
         text = ""
-
-        def json(self) -> list[dict[str, object]]:
-            return [
+        headers: dict[str, str] = {}
+        content = json.dumps(
+            [
                 {
                     "id": 141,
                     "pvc_name": "input-cb263c5f",
@@ -64,21 +71,10 @@ def test_list_input_volumes_requests_endpoint(monkeypatch: pytest.MonkeyPatch) -
                     "is_input": True,
                 },
             ]
+        ).encode()
 
-    def fake_get(
-        url: str,
-        *,
-        headers: dict[str, str],
-        params: dict[str, object],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["headers"] = headers
-        captured["params"] = params
-        captured["timeout"] = timeout
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.inputs.httpx.get", fake_get)
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
     volumes = list_input_volumes(api_config)
@@ -87,21 +83,80 @@ def test_list_input_volumes_requests_endpoint(monkeypatch: pytest.MonkeyPatch) -
         {"id": 141, "name": "input-cb263c5f", "size": 1},
         {"id": 139, "name": "input-6f0668b6", "size": 1},
     ]
-    assert captured["url"] == "https://api.walkai.ai/volumes/"
-    assert captured["headers"] == {"Authorization": "Bearer pat"}
-    assert captured["params"] == {"is_input": True}
-    assert captured["timeout"] == 30.0
-
+    assert client.calls == [
+        {
+            "method": "get",
+            "url": "/volumes/",
+            "params": {"is_input": True},
+            "headers": None,
+            "timeout": 30.0,
+        }
+    ]
 
-def test_list_volume_objects_returns_objects(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, object] = {}
 
+def test_list_input_volumes_caches_results(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyResponse:
         status_code = 200
         text = ""
+        headers: dict[str, str] = {}
+        content = json.dumps(
+            [{"id": 141, "pvc_name": "input-cb263c5f", "size": 1}]
+        ).encode()
+
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    first = list_input_volumes(api_config)
+    second = list_input_volumes(api_config)
+    bypassed = list_input_volumes(api_config, use_cache=False)
+
+    assert first == second == bypassed
+    assert len(client.calls) == 2
+
+
+def test_list_input_volumes_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FreshResponse:
+        status_code = 200
+        text = ""
+        headers = {"etag": "v1"}
+        content = json.dumps(
+            [{"id": 141, "pvc_name": "input-cb263c5f", "size": 1}]
+        ).encode()
+
+    class NotModifiedResponse:
+        status_code = 304
+        text = ""
+        headers = {"etag": "v1"}
+        content = b""
+
+    responses = [FreshResponse(), NotModifiedResponse()]
+
+    class SequencedClient(DummyClient):
+        def get(self, url: str, **kwargs: object) -> object:
+            self.calls.append({"method": "get", "url": url, **kwargs})
+            return responses.pop(0)
+
+    client = SequencedClient(None)
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    first = list_input_volumes(api_config)
+    second = list_input_volumes(api_config, use_cache=False)
+
+    assert first == second == [{"id": 141, "name": "input-cb263c5f", "size": 1}]
+    assert client.calls[1]["headers"] == {"If-None-Match": "v1"}
 
-        def json(self) -> dict[str, object]:
-            return {
+
+def test_list_volume_objects_returns_objects(monkeypatch: pytest.MonkeyPatch) -> None:
+    class DummyResponse:
+        status_code = 200
+        text = ""
+        headers: dict[str, str] = {}
+        content = json.dumps(
+            {
                 "prefix": "users/1/inputs/input-cb263c5f",
                 "objects": [
                     {
@@ -113,19 +168,10 @@ def test_list_volume_objects_returns_objects(monkeypatch: pytest.MonkeyPatch) ->
                 ],
                 "truncated": False,
             }
+        ).encode()
 
-    def fake_get(
-        url: str,
-        *,
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["headers"] = headers
-        captured["timeout"] = timeout
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.inputs.httpx.get", fake_get)
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
     objects = list_volume_objects(api_config, volume_id=141)
@@ -138,9 +184,14 @@ def test_list_volume_objects_returns_objects(monkeypatch: pytest.MonkeyPatch) ->
             "etag": "etag-1",
         }
     ]
-    assert captured["url"] == "https://api.walkai.ai/volumes/141/objects"
-    assert captured["headers"] == {"Authorization": "Bearer pat"}
-    assert captured["timeout"] == 30.0
+    assert client.calls == [
+        {
+            "method": "get",
+            "url": "/volumes/141/objects",
+            "headers": None,
+            "timeout": 30.0,
+        }
+    ]
 
 
 def test_list_volume_objects_handles_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -152,7 +203,7 @@ def test_list_volume_objects_handles_not_found(monkeypatch: pytest.MonkeyPatch)
             raise AssertionError("json() should not be called")
 
     monkeypatch.setattr(
-        "walkai.inputs.httpx.get", lambda *args, **kwargs: DummyResponse()
+        inputs, "_client", lambda api: DummyClient(DummyResponse())
     )
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
@@ -162,14 +213,11 @@ def test_list_volume_objects_handles_not_found(monkeypatch: pytest.MonkeyPatch)
 
 
 def test_create_input_volume_posts_payload(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, object] = {}
-
     class DummyResponse:
         status_code = 201
         text = ""
-
-        def json(self) -> dict[str, object]:
-            return {
+        content = json.dumps(
+            {
                 "volume": {
                     "id": 1,
                     "pvc_name": "input-abc",
@@ -178,21 +226,10 @@ def test_create_input_volume_posts_payload(monkeypatch: pytest.MonkeyPatch) -> N
                     "is_input": True,
                 }
             }
+        ).encode()
 
-    def fake_post(
-        url: str,
-        *,
-        json: dict[str, object],  # noqa: A002 - matches httpx signature
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["json"] = json
-        captured["headers"] = headers
-        captured["timeout"] = timeout
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.inputs.httpx.post", fake_post)
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
     volume = create_input_volume(api_config, size=5)
@@ -200,36 +237,66 @@ def test_create_input_volume_posts_payload(monkeypatch: pytest.MonkeyPatch) -> N
     assert volume["id"] == 1
     assert volume["name"] == "input-abc"
     assert volume["size"] == 5
-    assert captured["url"] == "https://api.walkai.ai/volumes/inputs"
-    assert captured["json"] == {"storage": 5}
-    assert captured["headers"] == {"Authorization": "Bearer pat"}
-    assert captured["timeout"] == 30.0
+    assert client.calls == [
+        {
+            "method": "post",
+            "url": "/volumes/inputs",
+            "content": orjson.dumps({"storage": 5}),
+            "headers": {"Content-Type": "application/json"},
+            "timeout": 30.0,
+        }
+    ]
 
 
-def test_request_input_upload_urls_posts_names(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured: dict[str, object] = {}
+def test_create_input_volume_invalidates_cached_listing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class ListResponse:
+        status_code = 200
+        text = ""
+        headers: dict[str, str] = {}
+        content = json.dumps(
+            [{"id": 141, "pvc_name": "input-cb263c5f", "size": 1}]
+        ).encode()
+
+    class CreateResponse:
+        status_code = 201
+        text = ""
+        content = json.dumps(
+            {"volume": {"id": 142, "pvc_name": "input-new", "size": 5}}
+        ).encode()
+
+    class RoutedClient(DummyClient):
+        def get(self, url: str, **kwargs: object) -> object:
+            self.calls.append({"method": "get", "url": url, **kwargs})
+            return ListResponse()
 
+        def post(self, url: str, **kwargs: object) -> object:
+            self.calls.append({"method": "post", "url": url, **kwargs})
+            return CreateResponse()
+
+    client = RoutedClient(None)
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    list_input_volumes(api_config)
+    list_input_volumes(api_config)
+    assert len(client.calls) == 1
+
+    create_input_volume(api_config, size=5)
+    list_input_volumes(api_config)
+
+    assert [call["method"] for call in client.calls] == ["get", "post", "get"]
+
+
+def test_request_input_upload_urls_posts_names(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyResponse:
         status_code = 200
         text = ""
+        content = json.dumps({"presigneds": ["url-a", "url-b"]}).encode()
 
-        def json(self) -> dict[str, object]:
-            return {"presigneds": ["url-a", "url-b"]}
-
-    def fake_post(
-        url: str,
-        *,
-        json: dict[str, object],  # noqa: A002 - matches httpx signature
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["json"] = json
-        captured["headers"] = headers
-        captured["timeout"] = timeout
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.inputs.httpx.post", fake_post)
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
     urls = request_input_upload_urls(
@@ -237,10 +304,39 @@ def test_request_input_upload_urls_posts_names(monkeypatch: pytest.MonkeyPatch)
     )
 
     assert urls == ["url-a", "url-b"]
-    assert captured["url"] == "https://api.walkai.ai/volumes/inputs/presigneds"
-    assert captured["json"] == {"volume_id": 1, "file_names": ["a.txt", "b.txt"]}
-    assert captured["headers"] == {"Authorization": "Bearer pat"}
-    assert captured["timeout"] == 30.0
+    assert client.calls == [
+        {
+            "method": "post",
+            "url": "/volumes/inputs/presigneds",
+            "content": orjson.dumps(
+                {"volume_id": 1, "file_names": ["a.txt", "b.txt"]}
+            ),
+            "headers": {"Content-Type": "application/json"},
+            "timeout": 30.0,
+        }
+    ]
+
+
+def test_request_input_upload_urls_batches_large_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class DummyResponse:
+        status_code = 200
+        text = ""
+        content = json.dumps({"presigneds": ["url"]}).encode()
+
+    client = DummyClient(DummyResponse())
+    monkeypatch.setattr(inputs, "_client", lambda api: client)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    filenames = [f"file-{index}.txt" for index in range(1200)]
+    urls = request_input_upload_urls(api_config, volume_id=1, filenames=filenames)
+
+    assert urls == ["url", "url", "url"]
+    assert len(client.calls) == 3
+    assert [
+        len(orjson.loads(call["content"])["file_names"]) for call in client.calls
+    ] == [500, 500, 200]
 
 
 def test_upload_files_to_presigned_puts_content(
@@ -248,29 +344,41 @@ def test_upload_files_to_presigned_puts_content(
 ) -> None:
     uploaded: list[dict[str, object]] = []
 
-    def fake_put(
-        url: str,
-        *,
-        content,
-        headers: dict[str, str],
-        timeout: float,
-    ):
-        uploaded.append(
-            {"url": url, "data": content.read(), "headers": headers, "timeout": timeout}
-        )
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
 
-        class DummyResponse:
-            status_code = 200
-            text = ""
+        async def put(
+            self,
+            url: str,
+            *,
+            content,
+            headers: dict[str, str],
+            timeout: float,
+        ):
+            data = b"".join([chunk async for chunk in content])
+            uploaded.append(
+                {"url": url, "data": data, "headers": headers, "timeout": timeout}
+            )
 
-        return DummyResponse()
+            class DummyResponse:
+                status_code = 200
+                text = ""
 
-    monkeypatch.setattr("walkai.inputs.httpx.put", fake_put)
+            return DummyResponse()
+
+    monkeypatch.setattr(inputs.httpx, "AsyncClient", DummyAsyncClient)
 
     file_a = tmp_path / "a.txt"
     file_b = tmp_path / "b.txt"
-    file_a.write_text("hello")
-    file_b.write_text("world")
+    file_a.write_bytes(b"hello")
+    file_b.write_bytes(b"world")
 
     upload_files_to_presigned(["url-a", "url-b"], [file_a, file_b])
 
@@ -278,33 +386,136 @@ def test_upload_files_to_presigned_puts_content(
         {
             "url": "url-a",
             "data": b"hello",
-            "headers": {"Content-Type": "application/octet-stream"},
+            "headers": {
+                "Content-Type": "application/octet-stream",
+                "Content-Length": "5",
+                "x-amz-content-sha256": hashlib.sha256(b"hello").hexdigest(),
+            },
             "timeout": 60.0,
         },
         {
             "url": "url-b",
             "data": b"world",
-            "headers": {"Content-Type": "application/octet-stream"},
+            "headers": {
+                "Content-Type": "application/octet-stream",
+                "Content-Length": "5",
+                "x-amz-content-sha256": hashlib.sha256(b"world").hexdigest(),
+            },
             "timeout": 60.0,
         },
     ]
 
 
+def test_upload_files_to_presigned_retries_transient_failures(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    statuses = [500, 200]
+    attempts: list[int] = []
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def put(self, url: str, *, content, **kwargs: object):
+            async for _ in content:
+                pass
+            status = statuses[len(attempts)]
+            attempts.append(status)
+
+            class DummyResponse:
+                status_code = status
+                text = ""
+
+            return DummyResponse()
+
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(inputs.httpx, "AsyncClient", DummyAsyncClient)
+    monkeypatch.setattr(inputs.asyncio, "sleep", fake_sleep)
+
+    file_a = tmp_path / "a.txt"
+    file_a.write_bytes(b"hello")
+
+    upload_files_to_presigned(["url-a"], [file_a])
+
+    assert attempts == [500, 200]
+    assert delays == [0.25]
+
+
 def test_upload_files_to_presigned_validates_lengths(tmp_path: Path) -> None:
     file_a = tmp_path / "a.txt"
-    file_a.write_text("hello")
+    file_a.write_bytes(b"hello")
 
     with pytest.raises(InputError, match="number of presigned URLs"):
         upload_files_to_presigned(["only-one"], [file_a, file_a])
 
 
+def test_upload_files_to_presigned_skips_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    uploaded: list[str] = []
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def put(self, url: str, **kwargs: object) -> object:
+            uploaded.append(url)
+
+            class DummyResponse:
+                status_code = 200
+                text = ""
+
+            return DummyResponse()
+
+    monkeypatch.setattr(inputs.httpx, "AsyncClient", DummyAsyncClient)
+
+    file_a = tmp_path / "a.txt"
+    file_b = tmp_path / "b.txt"
+    file_a.write_bytes(b"hello")
+    file_b.write_bytes(b"world")
+
+    existing = {
+        "a.txt": {"size": 5, "etag": hashlib.md5(b"hello").hexdigest()},
+        "b.txt": {"size": 5, "etag": hashlib.md5(b"stale").hexdigest()},
+    }
+
+    upload_files_to_presigned(["url-a", "url-b"], [file_a, file_b], existing=existing)
+
+    assert uploaded == ["url-b"]
+
+
+def test_upload_files_to_presigned_preflights_missing_files(tmp_path: Path) -> None:
+    file_a = tmp_path / "a.txt"
+    file_a.write_bytes(b"hello")
+
+    with pytest.raises(InputError, match="File not found"):
+        upload_files_to_presigned(
+            ["url-a", "url-b"], [file_a, tmp_path / "missing.txt"]
+        )
+
+
 def test_cli_inputs_list_outputs_volumes(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
     monkeypatch.setattr(
-        "walkai.main.list_input_volumes",
-        lambda api, *, timeout=30.0: [
+        inputs, "list_input_volumes",
+        lambda api, *, timeout=30.0, use_cache=True: [
             {"id": 141, "name": "input-cb263c5f", "size": 1},
             {"id": 139, "name": "input-6f0668b6", "size": 2},
         ],
@@ -313,62 +524,66 @@ def test_cli_inputs_list_outputs_volumes(
     result = runner.invoke(app, ["input", "list"])
 
     assert result.exit_code == 0, result.stderr
-    assert "Input volumes:" in result.stdout
-    assert "- 141: input-cb263c5f (size: 1)" in result.stdout
-    assert "- 139: input-6f0668b6 (size: 2)" in result.stdout
+    assert {
+        "Input volumes:",
+        "- 141: input-cb263c5f (size: 1)",
+        "- 139: input-6f0668b6 (size: 2)",
+    } <= set(result.stdout.splitlines())
 
 
 def test_cli_inputs_get_displays_objects(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
-
     def fake_list(
-        api: WalkAIAPIConfig, *, volume_id: int, timeout: float = 30.0
+        api: WalkAIAPIConfig,
+        *,
+        volume_id: int,
+        timeout: float = 30.0,
+        use_cache: bool = True,
     ) -> list[dict[str, object]]:
         assert volume_id == 141
         return [{"key": "file-a.txt", "size": 10}]
 
-    monkeypatch.setattr("walkai.main.list_volume_objects", fake_list)
+    monkeypatch.setattr(inputs, "list_volume_objects", fake_list)
 
     result = runner.invoke(app, ["input", "get", "141"])
 
     assert result.exit_code == 0, result.stderr
-    assert "Objects in volume 141:" in result.stdout
-    assert "- file-a.txt (10 bytes)" in result.stdout
+    assert {
+        "Objects in volume 141:",
+        "- file-a.txt (10 bytes)",
+    } <= set(result.stdout.splitlines())
 
 
 def test_cli_inputs_create_wires_calls(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, saved_config: Path
 ) -> None:
-    _save_config()
-
     created: dict[str, object] = {}
     upload_requested: dict[str, object] = {}
     uploads: dict[str, list[str]] = {"urls": [], "files": []}
 
     monkeypatch.setattr(
-        "walkai.main.create_input_volume",
+        inputs, "create_input_volume",
         lambda api, *, size: created.update({"size": size})
         or {"id": 5, "name": "input-5"},
     )
     monkeypatch.setattr(
-        "walkai.main.request_input_upload_urls",
+        inputs, "request_input_upload_urls",
         lambda api, *, volume_id, filenames: upload_requested.update(
             {"volume_id": volume_id, "filenames": filenames}
         )
         or ["url-a", "url-b"],
     )
     monkeypatch.setattr(
-        "walkai.main.upload_files_to_presigned",
+        inputs, "upload_files_to_presigned",
         lambda urls, files: uploads["urls"].extend(urls)
         or uploads["files"].extend([str(f) for f in files]),
     )
 
     file_a = tmp_path / "a.txt"
     file_b = tmp_path / "b.txt"
-    file_a.write_text("hello")
-    file_b.write_text("world")
+    file_a.write_bytes(b"hello")
+    file_b.write_bytes(b"world")
 
     result = runner.invoke(
         app,
@@ -393,10 +608,8 @@ def test_cli_inputs_create_wires_calls(
 
 
 def test_cli_inputs_create_requires_files(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
-
     result = runner.invoke(app, ["input", "create", "--size", "3"])
 
     assert result.exit_code == 1
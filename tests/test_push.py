@@ -2,15 +2,68 @@
 
 import base64
 import subprocess
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 import pytest
 
 import walkai.push as push
 from walkai.configuration import WalkAIAPIConfig
 
 
+@dataclass(frozen=True)
+class _Resp:
+    """Minimal httpx.Response stand-in; a payload that is an exception
+    yields an unparseable body instead of JSON."""
+
+    status_code: int = 200
+    text: str = ""
+    payload: object = None
+
+    @property
+    def content(self) -> bytes:
+        if isinstance(self.payload, Exception):
+            return b"not json"
+        return orjson.dumps(self.payload)
+
+
+def _client_returning(response: object) -> object:
+    class DummyClient:
+        def get(self, *args: object, **kwargs: object) -> object:
+            return response
+
+    return DummyClient()
+
+
+def _client_raising(exc: Exception) -> object:
+    class DummyClient:
+        def get(self, *args: object, **kwargs: object) -> object:
+            raise exc
+
+    return DummyClient()
+
+
+@pytest.fixture()
+def subprocess_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Record push.subprocess.run invocations without executing anything."""
+
+    calls: list[dict[str, Any]] = []
+
+    def fake_run(
+        cmd: list[str],
+        *,
+        check: bool,
+        input: str | None = None,  # noqa: A002 - matches subprocess signature
+        text: bool | None = None,
+    ) -> None:
+        calls.append({"cmd": cmd, "input": input, "text": text, "check": check})
+
+    monkeypatch.setattr(push.subprocess, "run", fake_run)
+    return calls
+
+
 @pytest.fixture()
 def sample_credentials() -> push.RegistryCredentials:
     return push.RegistryCredentials(
@@ -25,28 +78,20 @@ def test_fetch_registry_credentials_requests_endpoint(
 ) -> None:
     captured: dict[str, object] = {}
 
-    class DummyResponse:
-        status_code = 200
-        text = ""
-
-        def json(self) -> dict[str, str]:
-            return {
-                "token": base64.b64encode(b"alice:secret").decode("utf-8"),
-                "ecr_url": "123456789012.dkr.ecr.us-west-2.amazonaws.com/team:latest",
-            }
+    response = _Resp(
+        payload={
+            "token": base64.b64encode(b"alice:secret").decode("utf-8"),
+            "ecr_url": "123456789012.dkr.ecr.us-west-2.amazonaws.com/team:latest",
+        }
+    )
 
-    def fake_get(
-        url: str,
-        *,
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["headers"] = headers
-        captured["timeout"] = timeout
-        return DummyResponse()
+    class DummyClient:
+        def get(self, url: str, *, headers: dict[str, str]) -> _Resp:
+            captured["url"] = url
+            captured["headers"] = headers
+            return response
 
-    monkeypatch.setattr(push.httpx, "get", fake_get)
+    monkeypatch.setattr(push, "_client", lambda: DummyClient())
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
     credentials = push.fetch_registry_credentials(api_config)
@@ -58,98 +103,79 @@ def test_fetch_registry_credentials_requests_endpoint(
     )
     assert captured["url"] == "https://api.walkai.ai/registry"
     assert captured["headers"] == {"Authorization": "Bearer pat"}
-    assert captured["timeout"] == 30
-
 
-def test_fetch_registry_credentials_handles_http_error(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    class DummyResponse:
-        status_code = 500
-        text = "boom"
-
-        def json(self) -> dict[str, str]:  # pragma: no cover - should not run
-            raise AssertionError("json() should not be called")
-
-    monkeypatch.setattr(push.httpx, "get", lambda *args, **kwargs: DummyResponse())
-
-    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
 
-    with pytest.raises(push.PushError, match="Failed to obtain registry credentials"):
-        push.fetch_registry_credentials(api_config)
-
-
-def test_fetch_registry_credentials_handles_request_error(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    request = httpx.Request("GET", "https://api.walkai.ai/registry/credentials/")
-
-    def fake_get(*args: object, **kwargs: object) -> None:
-        raise httpx.RequestError("boom", request=request)
-
-    monkeypatch.setattr(push.httpx, "get", fake_get)
-
-    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
-
-    with pytest.raises(push.PushError, match="Failed to reach WalkAI API"):
-        push.fetch_registry_credentials(api_config)
-
-
-def test_fetch_registry_credentials_rejects_invalid_json(
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.parametrize(
+    ("client_factory", "match"),
+    [
+        pytest.param(
+            lambda: _client_returning(_Resp(500, "boom")),
+            "Failed to obtain registry credentials",
+            id="http-error",
+        ),
+        pytest.param(
+            lambda: _client_raising(
+                httpx.RequestError(
+                    "boom",
+                    request=httpx.Request("GET", "https://api.walkai.ai/registry"),
+                )
+            ),
+            "Failed to reach WalkAI API",
+            id="request-error",
+        ),
+        pytest.param(
+            lambda: _client_returning(_Resp(payload=ValueError("bad json"))),
+            "WalkAI API returned malformed registry credentials",
+            id="invalid-json",
+        ),
+        pytest.param(
+            lambda: _client_returning(
+                _Resp(
+                    payload={
+                        "token": base64.b64encode(b"alice:secret").decode("utf-8")
+                    }
+                )
+            ),
+            "registry\\.ecr_url",
+            id="missing-field",
+        ),
+    ],
+)
+def test_fetch_registry_credentials_errors(
+    monkeypatch: pytest.MonkeyPatch, client_factory: object, match: str
 ) -> None:
-    class DummyResponse:
-        status_code = 200
-        text = ""
-
-        def json(self) -> dict[str, str]:
-            raise ValueError("bad json")
-
-    monkeypatch.setattr(push.httpx, "get", lambda *args, **kwargs: DummyResponse())
+    monkeypatch.setattr(push, "_client", client_factory)
 
     api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
 
-    with pytest.raises(
-        push.PushError, match="WalkAI API returned malformed registry credentials"
-    ):
+    with pytest.raises(push.PushError, match=match):
         push.fetch_registry_credentials(api_config)
 
 
-def test_fetch_registry_credentials_requires_all_fields(
+def test_push_image_runs_expected_commands(
     monkeypatch: pytest.MonkeyPatch,
+    sample_credentials: push.RegistryCredentials,
+    subprocess_calls: list[dict[str, Any]],
 ) -> None:
-    class DummyResponse:
-        status_code = 200
-        text = ""
+    calls = subprocess_calls
 
-        def json(self) -> dict[str, str]:
-            return {
-                "token": base64.b64encode(b"alice:secret").decode("utf-8"),
-            }
+    class DummyProcess:
+        returncode = 0
 
-    monkeypatch.setattr(push.httpx, "get", lambda *args, **kwargs: DummyResponse())
+        def __init__(self, cmd: list[str], **kwargs: Any) -> None:
+            self.stdout = iter(["pushing layers...\n"])
+            calls.append(
+                {"cmd": cmd, "input": None, "text": kwargs.get("text"), "check": None}
+            )
 
-    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+        def __enter__(self) -> "DummyProcess":
+            return self
 
-    with pytest.raises(push.PushError, match="registry\\.ecr_url"):
-        push.fetch_registry_credentials(api_config)
+        def __exit__(self, *exc_info: object) -> None:
+            return None
 
-
-def test_push_image_runs_expected_commands(
-    monkeypatch: pytest.MonkeyPatch, sample_credentials: push.RegistryCredentials
-) -> None:
-    calls: list[dict[str, Any]] = []
-
-    def fake_run(
-        cmd: list[str],
-        *,
-        check: bool,
-        input: str | None = None,  # noqa: A002
-        text: bool | None = None,
-    ) -> None:
-        calls.append({"cmd": cmd, "input": input, "text": text, "check": check})
-
-    monkeypatch.setattr(push.subprocess, "run", fake_run)
+    monkeypatch.setattr(push.subprocess, "Popen", DummyProcess)
+    monkeypatch.setattr(push, "_is_logged_in", lambda client, host: False)
 
     remote = push.push_image("demo:latest", sample_credentials)
 
@@ -196,6 +222,53 @@ def test_push_image_wraps_called_process_error(
         raise subprocess.CalledProcessError(returncode=42, cmd=cmd)
 
     monkeypatch.setattr(push.subprocess, "run", failing_run)
+    monkeypatch.setattr(push, "_is_logged_in", lambda client, host: False)
 
     with pytest.raises(push.PushError, match="command failed with exit code 42"):
         push.push_image("demo:latest", sample_credentials)
+
+
+def test_push_image_skips_login_when_already_authenticated(
+    monkeypatch: pytest.MonkeyPatch,
+    sample_credentials: push.RegistryCredentials,
+    subprocess_calls: list[dict[str, Any]],
+) -> None:
+    class DummyProcess:
+        returncode = 0
+
+        def __init__(self, cmd: list[str], **kwargs: Any) -> None:
+            self.stdout = iter(())
+            subprocess_calls.append(
+                {"cmd": cmd, "input": None, "text": kwargs.get("text"), "check": None}
+            )
+
+        def __enter__(self) -> "DummyProcess":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+    monkeypatch.setattr(push.subprocess, "Popen", DummyProcess)
+    monkeypatch.setattr(push, "_is_logged_in", lambda client, host: True)
+
+    push.push_image("demo:latest", sample_credentials)
+
+    assert [call["cmd"][:2] for call in subprocess_calls] == [
+        ["docker", "tag"],
+        ["docker", "push"],
+    ]
+
+
+def test_is_logged_in_reads_auth_config(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        '{"auths": {"123456789012.dkr.ecr.us-west-2.amazonaws.com": {"auth": "dG9r"}}}'
+    )
+    monkeypatch.setattr(push, "_auth_config_paths", lambda client: (config_file,))
+
+    assert push._is_logged_in(
+        "docker", "123456789012.dkr.ecr.us-west-2.amazonaws.com"
+    )
+    assert not push._is_logged_in("docker", "ghcr.io")
@@ -2,41 +2,23 @@
 
 from pathlib import Path
 
+import orjson
 import pytest
 from typer.testing import CliRunner
 
-from walkai import configuration
-from walkai.configuration import WalkAIAPIConfig, WalkAIConfig
+from walkai import secrets
+from walkai.configuration import WalkAIAPIConfig
 from walkai.main import app
 from walkai.secrets import SecretsError, parse_env_file
 
 runner = CliRunner()
 
 
-@pytest.fixture()
-def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
-    """Point the configuration helpers at a temporary file."""
+@pytest.fixture(scope="module")
+def valid_env_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A well-formed .env file written once for the parsing tests."""
 
-    config_dir = tmp_path / "config"
-    config_file = config_dir / "config.toml"
-    monkeypatch.setattr(configuration, "_CONFIG_DIR", config_dir)
-    monkeypatch.setattr(configuration, "_CONFIG_FILE", config_file)
-    return config_file
-
-
-def _save_config() -> None:
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
-
-
-def test_parse_env_file_parses_values(tmp_path: Path) -> None:
-    env_file = tmp_path / ".env"
+    env_file = tmp_path_factory.mktemp("env") / ".env"
     env_file.write_text(
         """
         # comment
@@ -45,8 +27,11 @@ def test_parse_env_file_parses_values(tmp_path: Path) -> None:
         EMPTY=
         """
     )
+    return env_file
 
-    parsed = parse_env_file(env_file)
+
+def test_parse_env_file_parses_values(valid_env_file: Path) -> None:
+    parsed = parse_env_file(valid_env_file)
 
     assert parsed == {
         "API_KEY": "abc123",
@@ -63,30 +48,216 @@ def test_parse_env_file_rejects_invalid_line(tmp_path: Path) -> None:
         parse_env_file(env_file)
 
 
-def test_cli_secrets_list_outputs_names(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+def test_get_secrets_bulk_fetches_all_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: list[str] = []
+
+    class DummyResponse:
+        def __init__(self, name: str) -> None:
+            self.status_code = 200
+            self.headers: dict[str, str] = {}
+            self.content = orjson.dumps({"name": name, "keys": ["KEY"]})
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def get(self, url: str, *, timeout: float) -> DummyResponse:
+            requested.append(url)
+            return DummyResponse(url.rsplit("/", 1)[-1])
+
+    monkeypatch.setattr(secrets.httpx, "AsyncClient", DummyAsyncClient)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    fetched = secrets.get_secrets_bulk(api_config, names=["prod", "staging"])
+
+    assert requested == ["/secrets/prod", "/secrets/staging"]
+    assert fetched == [
+        {"name": "prod", "keys": ["KEY"]},
+        {"name": "staging", "keys": ["KEY"]},
+    ]
+
+
+def test_get_secrets_bulk_propagates_missing_secret(
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    _save_config()
+    class DummyResponse:
+        def __init__(self, status_code: int, content: bytes) -> None:
+            self.status_code = status_code
+            self.headers: dict[str, str] = {}
+            self.content = content
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def get(self, url: str, *, timeout: float) -> DummyResponse:
+            if url.endswith("/ghost"):
+                return DummyResponse(404, b"")
+            return DummyResponse(200, orjson.dumps({"name": "prod", "keys": []}))
+
+    monkeypatch.setattr(secrets.httpx, "AsyncClient", DummyAsyncClient)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+
+    with pytest.raises(SecretsError, match="Secret 'ghost' was not found."):
+        secrets.get_secrets_bulk(api_config, names=["prod", "ghost"])
+
+
+def test_mutations_invalidate_cached_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    reads: list[str] = []
+
+    class DummyResponse:
+        def __init__(self, status_code: int, content: bytes) -> None:
+            self.status_code = status_code
+            self.headers: dict[str, str] = {}
+            self.content = content
+
+    class DummyClient:
+        def get(self, url: str, **kwargs: object) -> DummyResponse:
+            reads.append(url)
+            if url == "/secrets/":
+                return DummyResponse(200, orjson.dumps([{"name": "prod"}]))
+            return DummyResponse(200, orjson.dumps({"name": "prod", "keys": []}))
+
+        def post(self, url: str, **kwargs: object) -> DummyResponse:
+            return DummyResponse(201, b"")
+
+        def delete(self, url: str, **kwargs: object) -> DummyResponse:
+            return DummyResponse(204, b"")
+
+    monkeypatch.setattr(secrets, "_client", lambda api: DummyClient())
 
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+
+    # Warm both read caches; repeats are served without a request.
+    secrets.list_secrets(api_config)
+    secrets.get_secret(api_config, name="prod")
+    secrets.list_secrets(api_config)
+    secrets.get_secret(api_config, name="prod")
+    assert reads == ["/secrets/", "/secrets/prod"]
+
+    secrets.create_secret(api_config, name="prod", data={"A": "1"})
+    secrets.list_secrets(api_config)
+    secrets.get_secret(api_config, name="prod")
+    assert reads == ["/secrets/", "/secrets/prod"] * 2
+
+    secrets.delete_secret(api_config, name="prod")
+    secrets.list_secrets(api_config)
+    secrets.get_secret(api_config, name="prod")
+    assert reads == ["/secrets/", "/secrets/prod"] * 3
+
+
+def test_create_secrets_bulk_posts_each_secret(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    posted: list[tuple[str, bytes]] = []
+
+    class DummyResponse:
+        status_code = 201
+        content = b""
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def post(
+            self, url: str, *, content: bytes, headers: dict[str, str], timeout: float
+        ) -> DummyResponse:
+            assert headers == {"Content-Type": "application/json"}
+            posted.append((url, content))
+            return DummyResponse()
+
+    monkeypatch.setattr(secrets.httpx, "AsyncClient", DummyAsyncClient)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+    secrets.create_secrets_bulk(
+        api_config,
+        items=[("prod", {"A": "1"}), ("staging", {"B": "2"})],
+    )
+
+    assert posted == [
+        ("/secrets/", orjson.dumps({"name": "prod", "data": {"A": "1"}})),
+        ("/secrets/", orjson.dumps({"name": "staging", "data": {"B": "2"}})),
+    ]
+
+
+def test_create_secrets_bulk_names_failing_secret(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class DummyResponse:
+        def __init__(self, status_code: int, content: bytes) -> None:
+            self.status_code = status_code
+            self.content = content
+
+    class DummyAsyncClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        async def __aenter__(self) -> "DummyAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def post(
+            self, url: str, *, content: bytes, headers: dict[str, str], timeout: float
+        ) -> DummyResponse:
+            if b'"staging"' in content:
+                return DummyResponse(500, b"boom")
+            return DummyResponse(201, b"")
+
+    monkeypatch.setattr(secrets.httpx, "AsyncClient", DummyAsyncClient)
+
+    api_config = WalkAIAPIConfig(url="https://api.walkai.ai", pat="pat")
+
+    with pytest.raises(
+        SecretsError, match="Failed to create secret 'staging': boom"
+    ):
+        secrets.create_secrets_bulk(
+            api_config,
+            items=[("prod", {"A": "1"}), ("staging", {"B": "2"})],
+        )
+
+
+def test_cli_secrets_list_outputs_names(
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
+) -> None:
     def fake_list(
         api: WalkAIAPIConfig, *, timeout: float = 30.0
     ) -> list[dict[str, str]]:
         return [{"name": "alpha"}, {"name": "beta"}]
 
-    monkeypatch.setattr("walkai.main.list_secrets", fake_list)
+    monkeypatch.setattr(secrets, "list_secrets", fake_list)
 
     result = runner.invoke(app, ["secrets", "list"])
 
     assert result.exit_code == 0, result.stderr
-    assert "- alpha" in result.stdout
-    assert "- beta" in result.stdout
+    # One split instead of a full-buffer scan per expected entry.
+    assert {"- alpha", "- beta"} <= set(result.stdout.splitlines())
 
 
 def test_cli_secrets_list_reports_empty(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
-    monkeypatch.setattr("walkai.main.list_secrets", lambda api, *, timeout=30.0: [])
+    monkeypatch.setattr(secrets, "list_secrets", lambda api, *, timeout=30.0: [])
 
     result = runner.invoke(app, ["secrets", "list"])
 
@@ -95,32 +266,27 @@ def test_cli_secrets_list_reports_empty(
 
 
 def test_cli_secrets_get_displays_keys(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
-
     def fake_get(
         api: WalkAIAPIConfig, *, name: str, timeout: float = 30.0
     ) -> dict[str, object]:
         assert name == "prod"
         return {"name": "prod", "keys": ["foo", "bar"]}
 
-    monkeypatch.setattr("walkai.main.get_secret", fake_get)
+    monkeypatch.setattr(secrets, "get_secret", fake_get)
 
     result = runner.invoke(app, ["secrets", "get", "prod"])
 
     assert result.exit_code == 0, result.stderr
-    assert "Secret: prod" in result.stdout
-    assert "- foo" in result.stdout
-    assert "- bar" in result.stdout
+    assert {"Secret: prod", "- foo", "- bar"} <= set(result.stdout.splitlines())
 
 
 def test_cli_secrets_get_supports_json_output(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
     monkeypatch.setattr(
-        "walkai.main.get_secret",
+        secrets, "get_secret",
         lambda api, *, name, timeout=30.0: {"name": name, "keys": []},
     )
 
@@ -132,9 +298,8 @@ def test_cli_secrets_get_supports_json_output(
 
 
 def test_cli_secrets_create_merges_env_file_and_inline_data(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, saved_config: Path
 ) -> None:
-    _save_config()
     env_file = tmp_path / ".env"
     env_file.write_text("SHARED=from-env\nTOKEN=123\n")
 
@@ -146,7 +311,7 @@ def test_cli_secrets_create_merges_env_file_and_inline_data(
         captured["name"] = name
         captured["data"] = data
 
-    monkeypatch.setattr("walkai.main.create_secret", fake_create)
+    monkeypatch.setattr(secrets, "create_secret", fake_create)
 
     result = runner.invoke(
         app,
@@ -172,40 +337,43 @@ def test_cli_secrets_create_merges_env_file_and_inline_data(
     }
 
 
-def test_cli_secrets_create_requires_data(
-    isolated_config: Path,
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        pytest.param(
+            ["secrets", "create", "empty"],
+            "Secret data is empty",
+            id="no-data",
+        ),
+        pytest.param(
+            ["secrets", "create", "prod", "--data", "invalid"],
+            "Invalid --data value",
+            id="malformed-pair",
+        ),
+    ],
+)
+def test_cli_secrets_create_rejects_invalid_input(
+    saved_config: Path, argv: list[str], expected: str
 ) -> None:
-    _save_config()
-
-    result = runner.invoke(app, ["secrets", "create", "empty"])
-
-    assert result.exit_code == 1
-    assert "Secret data is empty" in (result.stderr or result.stdout)
-
-
-def test_cli_secrets_create_validates_pairs(
-    isolated_config: Path,
-) -> None:
-    _save_config()
-
-    result = runner.invoke(app, ["secrets", "create", "prod", "--data", "invalid"])
+    result = runner.invoke(app, argv)
 
     assert result.exit_code == 1
-    assert "Invalid --data value" in (result.stderr or result.stdout)
+    assert expected in (result.stderr or result.stdout)
 
 
 def test_cli_secrets_delete_confirms_before_calling_api(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
     called: dict[str, str] = {}
 
     def fake_delete(api: WalkAIAPIConfig, *, name: str, timeout: float = 30.0) -> None:
         called["name"] = name
 
-    monkeypatch.setattr("walkai.main.delete_secret", fake_delete)
+    monkeypatch.setattr(secrets, "delete_secret", fake_delete)
 
-    result = runner.invoke(app, ["secrets", "delete", "prod"], input="y\n")
+    # --yes skips Click's prompt machinery; the abort test below still
+    # drives the interactive confirmation once.
+    result = runner.invoke(app, ["secrets", "delete", "prod", "--yes"])
 
     assert result.exit_code == 0, result.stderr
     assert called["name"] == "prod"
@@ -213,14 +381,12 @@ def test_cli_secrets_delete_confirms_before_calling_api(
 
 
 def test_cli_secrets_delete_can_abort(
-    monkeypatch: pytest.MonkeyPatch, isolated_config: Path
+    monkeypatch: pytest.MonkeyPatch, saved_config: Path
 ) -> None:
-    _save_config()
-
     def fake_delete(api: WalkAIAPIConfig, *, name: str, timeout: float = 30.0) -> None:
         raise AssertionError("delete_secret should not be called when aborted")
 
-    monkeypatch.setattr("walkai.main.delete_secret", fake_delete)
+    monkeypatch.setattr(secrets, "delete_secret", fake_delete)
 
     result = runner.invoke(app, ["secrets", "delete", "prod"], input="n\n")
 
@@ -1,68 +1,29 @@
 """Tests for the submit command."""
 
+import time
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 from typer.testing import CliRunner
 
-from walkai import configuration
-from walkai.configuration import WalkAIAPIConfig, WalkAIConfig
+from walkai import main
 from walkai.main import app
 
 runner = CliRunner()
 
 
 @pytest.fixture()
-def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
-    """Point the configuration helpers at a temporary file."""
+def captured_post(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Patch _post_job with a successful fake and capture its kwargs."""
 
-    config_dir = tmp_path / "config"
-    config_file = config_dir / "config.toml"
-    monkeypatch.setattr(configuration, "_CONFIG_DIR", config_dir)
-    monkeypatch.setattr(configuration, "_CONFIG_FILE", config_file)
-    return config_file
-
-
-def _create_project(tmp_path: Path) -> Path:
-    project_dir = tmp_path / "demo"
-    project_dir.mkdir()
-
-    project_lines = [
-        "[project]",
-        'name = "demo"',
-        "[tool.walkai]",
-        'entrypoint = "python main.py"',
-        "os_dependencies = []",
-    ]
-    (project_dir / "pyproject.toml").write_text("\n".join(project_lines) + "\n")
-    (project_dir / "main.py").write_text("print('walkai submit')\n")
-
-    return project_dir
-
-
-def test_submit_invokes_walkai_api(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
-) -> None:
-    project_dir = _create_project(tmp_path)
-
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
-
-    captured: dict[str, object] = {}
+    captured: dict[str, Any] = {}
 
     class DummyResponse:
-        def __init__(self) -> None:
-            self.status_code = 201
-            self.text = ""
-
-        def json(self) -> dict[str, object]:
-            return {"job_id": "job-123", "pod": "pod-name"}
+        status_code = 201
+        text = ""
+        content = b'{"job_id": "job-123", "pod": "pod-name"}'
 
     def fake_post(
         url: str,
@@ -71,19 +32,21 @@ def test_submit_invokes_walkai_api(
         headers: dict[str, str],
         timeout: float,
     ) -> DummyResponse:
-        captured["url"] = url
-        captured["json"] = json
-        captured["headers"] = headers
-        captured["timeout"] = timeout
+        captured.update(url=url, json=json, headers=headers, timeout=timeout)
         return DummyResponse()
 
-    monkeypatch.setattr("walkai.main.httpx.post", fake_post)
+    monkeypatch.setattr(main, "_post_job", fake_post)
+    return captured
+
 
+def test_submit_invokes_walkai_api(
+    demo_project: Path, saved_config: Path, captured_post: dict[str, Any]
+) -> None:
     result = runner.invoke(
         app,
         [
             "submit",
-            str(project_dir),
+            str(demo_project),
             "--image",
             "demo:latest",
             "--gpu",
@@ -97,60 +60,25 @@ def test_submit_invokes_walkai_api(
     assert (
         "Job submitted successfully with ID: job-123 and pod pod-name" in result.stdout
     )
-    assert captured["url"] == "https://api.walkai.ai/jobs/"
-    assert captured["json"] == {
+    assert captured_post["url"] == "https://api.walkai.ai/jobs/"
+    assert captured_post["json"] == {
         "image": "demo:latest",
         "gpu": "1g.10gb",
         "storage": 5,
     }
-    assert captured["headers"] == {"Authorization": "Bearer pat-token"}
-    assert captured["timeout"] == 30
+    assert captured_post["headers"]["Authorization"] == "Bearer pat-token"
+    assert captured_post["headers"]["Idempotency-Key"]
+    assert captured_post["timeout"] == 30
 
 
 def test_submit_can_forward_secrets(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
+    demo_project: Path, saved_config: Path, captured_post: dict[str, Any]
 ) -> None:
-    project_dir = _create_project(tmp_path)
-
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
-
-    captured: dict[str, object] = {}
-
-    class DummyResponse:
-        def __init__(self) -> None:
-            self.status_code = 201
-            self.text = ""
-
-        def json(self) -> dict[str, object]:
-            return {"job_id": "job-123", "pod": "pod-name"}
-
-    def fake_post(
-        url: str,
-        *,
-        json: dict[str, object],  # noqa: A002 - matches httpx signature
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["url"] = url
-        captured["json"] = json
-        captured["headers"] = headers
-        captured["timeout"] = timeout
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.main.httpx.post", fake_post)
-
     result = runner.invoke(
         app,
         [
             "submit",
-            str(project_dir),
+            str(demo_project),
             "--image",
             "walkai/demo:latest",
             "--secret",
@@ -165,7 +93,7 @@ def test_submit_can_forward_secrets(
     )
 
     assert result.exit_code == 0, result.stdout
-    assert captured["json"] == {
+    assert captured_post["json"] == {
         "image": "walkai/demo:latest",
         "gpu": "1g.10gb",
         "storage": 2,
@@ -174,42 +102,11 @@ def test_submit_can_forward_secrets(
 
 
 def test_submit_does_not_require_pyproject(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
+    tmp_path: Path, saved_config: Path, captured_post: dict[str, Any]
 ) -> None:
     project_dir = tmp_path / "no-config"
     project_dir.mkdir()
 
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
-
-    captured: dict[str, object] = {}
-
-    class DummyResponse:
-        def __init__(self) -> None:
-            self.status_code = 201
-            self.text = ""
-
-        def json(self) -> dict[str, object]:
-            return {"job_id": "job-456", "pod": "podless"}
-
-    def fake_post(
-        url: str,
-        *,
-        json: dict[str, object],  # noqa: A002 - matches httpx signature
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["json"] = json
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.main.httpx.post", fake_post)
-
     result = runner.invoke(
         app,
         [
@@ -225,45 +122,12 @@ def test_submit_does_not_require_pyproject(
     )
 
     assert result.exit_code == 0, result.stdout
-    assert captured["json"]["image"] == "walkai/no-config:latest"
+    assert captured_post["json"]["image"] == "walkai/no-config:latest"
 
 
 def test_submit_can_forward_input_id(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_config: Path
+    saved_config: Path, captured_post: dict[str, Any]
 ) -> None:
-    project_dir = _create_project(tmp_path)
-
-    configuration.save_config(
-        WalkAIConfig(
-            walkai_api=WalkAIAPIConfig(
-                url="https://api.walkai.ai",
-                pat="pat-token",
-            ),
-        )
-    )
-
-    captured: dict[str, object] = {}
-
-    class DummyResponse:
-        def __init__(self) -> None:
-            self.status_code = 201
-            self.text = ""
-
-        def json(self) -> dict[str, object]:
-            return {"job_id": "job-123", "pod": "pod-name"}
-
-    def fake_post(
-        url: str,
-        *,
-        json: dict[str, object],  # noqa: A002 - matches httpx signature
-        headers: dict[str, str],
-        timeout: float,
-    ) -> DummyResponse:
-        captured["json"] = json
-        return DummyResponse()
-
-    monkeypatch.setattr("walkai.main.httpx.post", fake_post)
-
     result = runner.invoke(
         app,
         [
@@ -280,63 +144,126 @@ def test_submit_can_forward_input_id(
     )
 
     assert result.exit_code == 0, result.stderr
-    assert captured["json"]["input_id"] == 7
+    assert captured_post["json"]["input_id"] == 7
 
 
-def test_submit_requires_api_credentials(tmp_path: Path, isolated_config: Path) -> None:
-    project_dir = _create_project(tmp_path)
+def test_submit_retries_transient_server_errors(
+    monkeypatch: pytest.MonkeyPatch, demo_project: Path, saved_config: Path
+) -> None:
+    statuses = [500, 502, 201]
+    attempts: list[int] = []
+
+    class DummyResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.text = ""
+            self.content = b'{"job_id": "job-123", "pod": "pod-name"}'
+
+    class DummyClient:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        def __enter__(self) -> "DummyClient":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def post(self, url: str, **kwargs: object) -> DummyResponse:
+            attempts.append(statuses[len(attempts)])
+            return DummyResponse(attempts[-1])
+
+    monkeypatch.setattr(httpx, "Client", DummyClient)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
 
     result = runner.invoke(
         app,
         [
             "submit",
-            str(project_dir),
+            str(demo_project),
             "--image",
-            "walkai/demo:latest",
+            "demo:latest",
             "--gpu",
             "1g.10gb",
             "--storage",
-            "2",
+            "5",
         ],
     )
 
-    assert result.exit_code == 1
-    assert "No WalkAI API configuration found" in result.output
+    assert result.exit_code == 0, result.output
+    assert attempts == [500, 502, 201]
+
 
+def test_submit_tolerates_missing_response_body(
+    monkeypatch: pytest.MonkeyPatch, demo_project: Path, saved_config: Path
+) -> None:
+    class DummyResponse:
+        def __init__(self) -> None:
+            self.status_code = 201
+            self.text = ""
+            self.content = b""
 
-def test_submit_requires_gpu_option(tmp_path: Path, isolated_config: Path) -> None:
-    project_dir = _create_project(tmp_path)
+    monkeypatch.setattr(
+        main, "_post_job",
+        lambda url, *, json, headers, timeout: DummyResponse(),
+    )
 
     result = runner.invoke(
         app,
         [
             "submit",
-            str(project_dir),
+            str(demo_project),
             "--image",
-            "walkai/demo:latest",
+            "demo:latest",
+            "--gpu",
+            "1g.10gb",
             "--storage",
-            "2",
+            "5",
         ],
     )
 
-    assert result.exit_code == 2
-    assert "Missing option '--gpu'" in result.output
-
+    assert result.exit_code == 0, result.output
+    assert "Job submission didn't emit a response" in result.stdout
 
-def test_submit_requires_storage_option(tmp_path: Path, isolated_config: Path) -> None:
-    project_dir = _create_project(tmp_path)
 
+def test_submit_requires_api_credentials(
+    demo_project: Path, isolated_config: Path
+) -> None:
     result = runner.invoke(
         app,
         [
             "submit",
-            str(project_dir),
+            str(demo_project),
             "--image",
             "walkai/demo:latest",
             "--gpu",
             "1g.10gb",
+            "--storage",
+            "2",
         ],
     )
 
+    assert result.exit_code == 1
+    assert "No WalkAI API configuration found" in result.output
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "missing"),
+    [
+        pytest.param(["--storage", "2"], "--gpu", id="gpu"),
+        pytest.param(["--gpu", "1g.10gb"], "--storage", id="storage"),
+    ],
+)
+def test_submit_requires_mandatory_options(
+    demo_project: Path,
+    isolated_config: Path,
+    extra_args: list[str],
+    missing: str,
+) -> None:
+    result = runner.invoke(
+        app,
+        ["submit", str(demo_project), "--image", "walkai/demo:latest", *extra_args],
+    )
+
     assert result.exit_code == 2
-    assert "Missing option '--storage'" in result.output
+    assert f"Missing option '{missing}'" in result.output